@@ -7,17 +7,32 @@ This API provides endpoints for:
 - Word-level editing and saving
 """
 
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, g, request, jsonify, send_file, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+import requests
 from werkzeug.utils import secure_filename
+from werkzeug.security import safe_join
 import os
+import re
+import mimetypes
 import tempfile
+import logging
 import json
 from pathlib import Path
-import traceback
 import time
+import asyncio
+from functools import wraps
+import uuid
 import bcrypt
+import orjson
+import msgspec
+from typing import Any, Dict, List, Optional
 from pymongo import MongoClient
+from bson import ObjectId
+from bson.errors import InvalidId
+from botocore.config import Config as BotoConfig
 from datetime import datetime, timezone
 import zipfile
 from io import BytesIO
@@ -32,6 +47,8 @@ from backend.audio_diarization import process_diarization
 from backend.multilingual_transcription import transcribe_audio as multilingual_transcribe
 from pipeline.pipeline_config import LANGUAGE_CODES
 from utils.storage import StorageManager
+from utils.audio_utils import get_audio_duration
+from utils.logging_utils import setup_queue_logging
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -40,17 +57,51 @@ backend_dir = Path(__file__).parent
 env_path = backend_dir / '.env'
 load_dotenv(dotenv_path=env_path)
 
+# Log through a queue so request threads don't block on stdout
+setup_queue_logging()
+logger = logging.getLogger('api')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson, used by jsonify() and request.get_json().
+    Types orjson can't handle natively fall back to Flask's default encoder.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend
+app.json = OrjsonProvider(app)
+# In production nginx adds the CORS headers; only enable flask_cors for local development.
+# Handlers must not set Access-Control-* headers themselves or production responses get them twice.
+if os.getenv('FLASK_ENV') != 'production':
+    CORS(app)  # Enable CORS for frontend
 
 # Configuration
-UPLOAD_FOLDER = tempfile.mkdtemp()
-OUTPUT_FOLDER = tempfile.mkdtemp()
+UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER') or tempfile.mkdtemp()
+OUTPUT_FOLDER = os.getenv('OUTPUT_FOLDER') or tempfile.mkdtemp()
 AUDIO_FOLDER = os.path.join(UPLOAD_FOLDER, 'audio')
+AUDIO_FOLDER_PATH = Path(AUDIO_FOLDER)
 REFERENCE_FOLDER = os.path.join(UPLOAD_FOLDER, 'reference')
-ALLOWED_AUDIO_EXTENSIONS = {'mp3', 'wav', 'm4a', 'ogg', 'flac', 'aac'}
-ALLOWED_TEXT_EXTENSIONS = {'txt'}
+ALLOWED_AUDIO_EXTENSIONS = frozenset({'mp3', 'wav', 'm4a', 'ogg', 'flac', 'aac'})
+ALLOWED_TEXT_EXTENSIONS = frozenset({'txt'})
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
+# Projection for summary-only transcription listings (drops the large word/phrase arrays)
+SUMMARY_PROJECTION = {'transcription_data.words': 0, 'transcription_data.phrases': 0}
+# Uploaded audio never changes (names carry a random id), so the editor can cache it
+AUDIO_CACHE_MAX_AGE = 3600
+# Internal nginx location for AUDIO_FOLDER (e.g. '/internal_audio/'). When set, audio is
+# served by nginx via X-Accel-Redirect instead of being streamed through Flask.
+AUDIO_ACCEL_REDIRECT_PREFIX = os.getenv('AUDIO_ACCEL_REDIRECT_PREFIX', '')
 
 # Create directories
 os.makedirs(AUDIO_FOLDER, exist_ok=True)
@@ -61,43 +112,163 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['OUTPUT_FOLDER'] = OUTPUT_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
-# Initialize storage manager
-storage_manager = StorageManager()
+# Compress JSON responses (word/phrase arrays compress very well); audio is left untouched
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# Initialize storage manager with one shared S3 client, its connection pool sized for the
+# request threads plus the multipart transfer threads each upload starts (AUDIO_TRANSFER_CONFIG)
+storage_manager = StorageManager(boto_config=BotoConfig(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True
+))
 
 # Initialize MongoDB connection for users
 mongodb_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
 mongodb_database = os.getenv('MONGODB_DATABASE', 'transcription_db')
 try:
-    mongo_client = MongoClient(mongodb_uri)
+    # Keep a warm connection pool so requests don't pay connection setup + SCRAM auth
+    mongo_client = MongoClient(mongodb_uri, maxPoolSize=50, minPoolSize=10, connect=False)
     mongo_db = mongo_client[mongodb_database]
     users_collection = mongo_db['users']
     # Test connection
     mongo_client.admin.command('ping')
-    print(f"✅ Connected to MongoDB for user authentication: {mongodb_database}")
+    # Username lookups happen on every login/register, so keep them on an index
+    try:
+        users_collection.create_index('username', unique=True)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not create username index: {str(e)}")
+    logger.info(f"✅ Connected to MongoDB for user authentication: {mongodb_database}")
 except Exception as e:
-    print(f"❌ Warning: Could not connect to MongoDB for user authentication: {str(e)}")
+    logger.error(f"❌ Warning: Could not connect to MongoDB for user authentication: {str(e)}")
     users_collection = None
 
 
 def get_user_from_request():
     """
     Get user information from request headers (X-User-ID and X-Is-Admin).
+    Reads the WSGI environ directly to skip Werkzeug's case-insensitive header lookup.
     Returns tuple: (user_id, is_admin)
     """
-    user_id = request.headers.get('X-User-ID')
-    is_admin_str = request.headers.get('X-Is-Admin', 'false').lower()
-    is_admin = is_admin_str == 'true'
-    return user_id, is_admin
+    environ = request.environ
+    return environ.get('HTTP_X_USER_ID'), environ.get('HTTP_X_IS_ADMIN', 'false').lower() == 'true'
+
+
+def requires_admin(view):
+    """Reject the request with 403 unless the X-Is-Admin header is 'true'."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        _, is_admin = get_user_from_request()
+        if not is_admin:
+            logger.warning(f"❌ Admin access denied: {request.path}")
+            return jsonify({
+                'success': False,
+                'error': 'Admin access required'
+            }), 403
+        g.is_admin = True
+        return view(*args, **kwargs)
+    return wrapper
 
 
 def allowed_audio_file(filename):
     """Check if audio file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_AUDIO_EXTENSIONS
+    return os.path.splitext(filename)[1][1:].lower() in ALLOWED_AUDIO_EXTENSIONS
 
 
 def allowed_text_file(filename):
     """Check if text file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_TEXT_EXTENSIONS
+    return os.path.splitext(filename)[1][1:].lower() in ALLOWED_TEXT_EXTENSIONS
+
+
+def ojsonify(obj, status=200, option=None):
+    """
+    Build a JSON response using orjson instead of the stdlib encoder.
+    Used for endpoints that return large word/phrase arrays or Mongo documents
+    (ObjectId and other non-JSON types are encoded with str()).
+    """
+    return app.response_class(orjson.dumps(obj, default=str, option=option), status=status, mimetype='application/json')
+
+
+class SaveToDatabaseRequest(msgspec.Struct):
+    """JSON body for POST /api/transcription/save-to-database."""
+    transcription_data: Optional[Dict[str, Any]] = None
+    audio_filename: str = ''
+    audio_path: str = ''
+    transcription_type: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+class TranscriptionData(msgspec.Struct):
+    """Minimal shape of transcription_data checked before any S3/MongoDB work."""
+    words: Optional[List[Dict[str, Any]]] = None
+    phrases: Optional[List[Dict[str, Any]]] = None
+    metadata: Dict[str, Any] = {}
+
+
+def validate_transcription_data(transcription_data):
+    """
+    Check that transcription_data has a words or phrases list and a dict metadata.
+    
+    Returns:
+        Error message, or None if the payload is valid
+    """
+    try:
+        parsed = msgspec.convert(transcription_data, TranscriptionData)
+    except msgspec.ValidationError as e:
+        return f'Invalid transcription data: {str(e)}'
+    if parsed.words is None and parsed.phrases is None:
+        return 'Invalid transcription data: words or phrases is required'
+    return None
+
+
+class UpdateTranscriptionRequest(msgspec.Struct):
+    """JSON body for PUT /api/transcriptions/<id>."""
+    transcription_data: Dict[str, Any]
+    user_id: Optional[str] = None
+
+
+def decode_request(struct_type):
+    """
+    Decode and validate the raw request body into a msgspec Struct in one pass.
+    
+    Returns:
+        Tuple (struct_instance, error_message); error_message is None on success
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        return None, 'No data provided'
+    try:
+        return msgspec.json.decode(body, type=struct_type), None
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return None, f'Invalid request body: {str(e)}'
+
+
+# Matches HH:MM:SS:mmm and H:MM:SS.mmm timestamps
+_TIMESTAMP_RE = re.compile(r'(\d+):(\d+):(\d+(?:\.\d+)?)(?::(\d+))?$')
+
+
+def timestamp_to_seconds(ts: str) -> float:
+    """Convert a timestamp string (HH:MM:SS:mmm, H:MM:SS.mmm or MM:SS.mmm) to seconds."""
+    match = _TIMESTAMP_RE.match(ts)
+    if match:
+        hours, minutes, seconds, millis = match.groups()
+        total = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        return total + int(millis) / 1000.0 if millis else total
+    
+    parts = ts.split(':')
+    if len(parts) == 2:  # MM:SS.mmm
+        return float(parts[0]) * 60 + float(parts[1])
+    return float(ts)
+
+
+def word_duration(start_time: str, end_time: str) -> float:
+    """Duration in seconds between two timestamps, 0 if either is missing."""
+    if start_time and end_time:
+        return timestamp_to_seconds(end_time) - timestamp_to_seconds(start_time)
+    return 0
 
 
 @app.route('/api/health', methods=['GET'])
@@ -187,7 +358,7 @@ def login():
             'created_at': user.get('created_at', datetime.now(timezone.utc)).isoformat() if isinstance(user.get('created_at'), datetime) else user.get('created_at')
         }
         
-        print(f"✅ User logged in: {username}")
+        logger.info(f"✅ User logged in: {username}")
         
         return jsonify({
             'success': True,
@@ -196,9 +367,7 @@ def login():
         })
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error during login: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error during login: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -253,7 +422,7 @@ def register():
             }), 400
         
         # Check if username already exists
-        existing_user = users_collection.find_one({'username': username})
+        existing_user = users_collection.find_one({'username': username}, projection={'_id': 1})
         if existing_user:
             return jsonify({
                 'success': False,
@@ -286,7 +455,7 @@ def register():
             'created_at': user_doc['created_at'].isoformat()
         }
         
-        print(f"✅ New user registered: {username}")
+        logger.info(f"✅ New user registered: {username}")
         
         return jsonify({
             'success': True,
@@ -295,9 +464,7 @@ def register():
         }), 201
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error during registration: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error during registration: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -326,7 +493,7 @@ def get_languages():
 
 
 @app.route('/api/transcribe', methods=['POST'])
-def transcribe_audio():
+async def transcribe_audio():
     """
     Transcribe audio file with optional reference text.
     
@@ -393,8 +560,7 @@ def transcribe_audio():
         
         # Save audio file
         filename = secure_filename(audio_file.filename)
-        timestamp = int(time.time())
-        unique_filename = f"{timestamp}_{filename}"
+        unique_filename = f"{uuid.uuid4().hex[:12]}_{filename}"
         audio_path = os.path.join(AUDIO_FOLDER, unique_filename)
         audio_file.save(audio_path)
         
@@ -402,66 +568,42 @@ def transcribe_audio():
         output_filename = f"{Path(unique_filename).stem}_transcription.json"
         output_path = os.path.join(OUTPUT_FOLDER, output_filename)
         
-        print(f"📁 Processing file: {filename}")
-        print(f"🌐 Source Language: {source_language}")
-        print(f"🎯 Target Language: {target_language}")
+        logger.info(f"📁 Processing file: {filename}")
+        logger.info(f"🌐 Source Language: {source_language}")
+        logger.info(f"🎯 Target Language: {target_language}")
         if reference_text:
-            print(f"📝 Reference text provided: {len(reference_text)} characters")
-        
-        # Process transcription
-        result = process_diarization(
-            audio_path=audio_path,
-            output_json=output_path,
-            source_lang=source_language,
-            target_lang=target_language,
-            reference_passage=reference_text
+            logger.info(f"📝 Reference text provided: {len(reference_text)} characters")
+        
+        # Process transcription, reading the audio duration in parallel
+        result, audio_duration = await asyncio.gather(
+            asyncio.to_thread(
+                process_diarization,
+                audio_path=audio_path,
+                output_json=output_path,
+                source_lang=source_language,
+                target_lang=target_language,
+                reference_passage=reference_text
+            ),
+            asyncio.to_thread(get_audio_duration, audio_path)
         )
         
-        # Get audio duration from the audio file
-        from pydub import AudioSegment
-        audio = AudioSegment.from_file(audio_path)
-        audio_duration = len(audio) / 1000.0  # Convert to seconds
-        
         # Extract words from annotations
         # result structure: {"id": ..., "filename": ..., "annotations": [...]}
         # Each annotation: {"start": "H:MM:SS.mmm", "end": "H:MM:SS.mmm", "Transcription": ["word"]}
-        simplified_words = []
         annotations = result.get('annotations', [])
-        
-        for annotation in annotations:
-            # Extract word from Transcription array
-            transcription_list = annotation.get('Transcription', [])
-            word_text = transcription_list[0] if transcription_list else ''
-            
-            start_time = annotation.get('start', '')
-            end_time = annotation.get('end', '')
-            
-            # Calculate duration in seconds
-            duration = 0
-            if start_time and end_time:
-                # Convert timestamps to seconds for duration calculation
-                def timestamp_to_seconds(ts):
-                    parts = ts.split(':')
-                    if len(parts) == 3:  # H:MM:SS.mmm
-                        return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-                    elif len(parts) == 2:  # MM:SS.mmm
-                        return float(parts[0]) * 60 + float(parts[1])
-                    return float(ts)
-                
-                start_sec = timestamp_to_seconds(start_time)
-                end_sec = timestamp_to_seconds(end_time)
-                duration = end_sec - start_sec
-            
-            simplified_words.append({
-                'start': start_time,
-                'word': word_text,
-                'end': end_time,
-                'duration': duration,
+        simplified_words = [
+            {
+                'start': annotation.get('start', ''),
+                'word': (annotation.get('Transcription') or [''])[0],
+                'end': annotation.get('end', ''),
+                'duration': word_duration(annotation.get('start', ''), annotation.get('end', '')),
                 'language': source_language
-            })
+            }
+            for annotation in annotations
+        ]
         
-        print(f"✅ Transcription completed: {len(simplified_words)} words")
-        print(f"   Audio duration: {audio_duration:.3f}s")
+        logger.info(f"✅ Transcription completed: {len(simplified_words)} words")
+        logger.info(f"   Audio duration: {audio_duration:.3f}s")
         
         # Prepare response with minimal metadata (audio_path needed for frontend playback)
         response_data = {
@@ -480,15 +622,13 @@ def transcribe_audio():
             response_data['reference_text'] = reference_text
             response_data['has_reference'] = True
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data': response_data
         })
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error during transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error during transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -499,9 +639,30 @@ def transcribe_audio():
 
 @app.route('/api/audio/<filename>', methods=['GET'])
 def serve_audio(filename):
-    """Serve audio files."""
+    """Serve audio files (supports HTTP Range requests for seeking)."""
     try:
-        return send_from_directory(AUDIO_FOLDER, filename)
+        if AUDIO_ACCEL_REDIRECT_PREFIX:
+            # Hand the file off to nginx so it is sent with sendfile(2), outside of Python
+            audio_path = safe_join(AUDIO_FOLDER, filename)
+            if audio_path is None or not os.path.isfile(audio_path):
+                return jsonify({
+                    'success': False,
+                    'error': 'Audio file not found'
+                }), 404
+            
+            response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+            response.headers['X-Accel-Redirect'] = f"{AUDIO_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{filename}"
+            response.cache_control.public = True
+            response.cache_control.max_age = AUDIO_CACHE_MAX_AGE
+            return response
+        
+        return send_from_directory(
+            AUDIO_FOLDER,
+            filename,
+            conditional=True,
+            etag=True,
+            max_age=AUDIO_CACHE_MAX_AGE
+        )
     except Exception as e:
         return jsonify({
             'success': False,
@@ -519,9 +680,6 @@ def proxy_s3_audio():
         - key: S3 key (alternative to url)
     """
     try:
-        import requests
-        from io import BytesIO
-        
         s3_url = request.args.get('url')
         s3_key = request.args.get('key')
         
@@ -568,7 +726,7 @@ def proxy_s3_audio():
                         bucket = storage_manager.s3_bucket_name
                         key = s3_url.split('/')[-1]
                 
-                print(f"📦 Fetching from S3: bucket={bucket}, key={key}")
+                logger.info(f"📦 Fetching from S3: bucket={bucket}, key={key}")
                 
                 # Get object from S3
                 response = storage_manager.s3_client.get_object(Bucket=bucket, Key=key)
@@ -577,18 +735,16 @@ def proxy_s3_audio():
                 content_type = response.get('ContentType', 'audio/mpeg')
                 
                 # Stream the file
-                from flask import Response
                 return Response(
                     response['Body'].read(),
                     mimetype=content_type,
                     headers={
                         'Content-Disposition': f'inline; filename="{key.split("/")[-1]}"',
-                        'Access-Control-Allow-Origin': '*',
                         'Cache-Control': 'public, max-age=3600'
                     }
                 )
             except Exception as s3_error:
-                print(f"Error fetching from S3: {str(s3_error)}")
+                logger.error(f"Error fetching from S3: {str(s3_error)}")
                 # Fallback to direct URL fetch (may still have CORS issues)
                 pass
         
@@ -599,12 +755,10 @@ def proxy_s3_audio():
             
             content_type = response.headers.get('Content-Type', 'audio/mpeg')
             
-            from flask import Response
             return Response(
                 response.content,
                 mimetype=content_type,
                 headers={
-                    'Access-Control-Allow-Origin': '*',
                     'Cache-Control': 'public, max-age=3600'
                 }
             )
@@ -615,9 +769,7 @@ def proxy_s3_audio():
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error proxying S3 audio: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error proxying S3 audio: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -639,7 +791,7 @@ def get_transcription(filename):
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data': data
         })
@@ -682,12 +834,19 @@ def save_transcription():
             'edited_timestamp': int(time.time())
         }
         
-        # Save to file
+        # Save to file (write to a temp file and rename so readers never see a partial file)
         output_path = os.path.join(OUTPUT_FOLDER, filename)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        # (unique temp name per save, so concurrent saves of the same file never share one)
+        fd, tmp_path = tempfile.mkstemp(dir=OUTPUT_FOLDER, prefix=f".{filename}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, output_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
         
-        print(f"💾 Saved edited transcription: {filename}")
+        logger.info(f"💾 Saved edited transcription: {filename}")
         
         return jsonify({
             'success': True,
@@ -696,9 +855,7 @@ def save_transcription():
         })
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error saving transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error saving transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -731,7 +888,7 @@ def download_transcription(filename):
 
 
 @app.route('/api/transcribe/phrases', methods=['POST'])
-def transcribe_phrases():
+async def transcribe_phrases():
     """
     Transcribe audio file with phrase-level timestamps, speaker diarization, and emotion detection.
     
@@ -776,8 +933,7 @@ def transcribe_phrases():
         
         # Save uploaded audio file
         filename = secure_filename(audio_file.filename)
-        timestamp = int(time.time())
-        unique_filename = f"{timestamp}_{filename}"
+        unique_filename = f"{uuid.uuid4().hex[:12]}_{filename}"
         audio_path = os.path.join(AUDIO_FOLDER, unique_filename)
         audio_file.save(audio_path)
         
@@ -785,50 +941,31 @@ def transcribe_phrases():
         output_filename = f"{Path(unique_filename).stem}_phrases_transcription.json"
         output_path = os.path.join(OUTPUT_FOLDER, output_filename)
         
-        print(f"📁 Processing file: {filename}")
-        print(f"🌐 Source Language: {source_language}")
+        logger.info(f"📁 Processing file: {filename}")
+        logger.info(f"🌐 Source Language: {source_language}")
         if reference_text:
-            print(f"📝 Reference text provided: {len(reference_text)} characters")
-        
-        # Process transcription
-        transcription_data = multilingual_transcribe(
-            audio_path=audio_path,
-            output_json=output_path,
-            source_language=source_language,
-            reference_text=reference_text
+            logger.info(f"📝 Reference text provided: {len(reference_text)} characters")
+        
+        # Process transcription, reading the audio duration in parallel
+        transcription_data, audio_duration = await asyncio.gather(
+            asyncio.to_thread(
+                multilingual_transcribe,
+                audio_path=audio_path,
+                output_json=output_path,
+                source_language=source_language,
+                reference_text=reference_text,
+                # The on-disk chunk cache is for resuming CLI runs; it would grow without bound here
+                cache_dir=None
+            ),
+            asyncio.to_thread(get_audio_duration, audio_path)
         )
         
-        # Get audio duration from the audio file
-        from pydub import AudioSegment
-        audio = AudioSegment.from_file(audio_path)
-        audio_duration = len(audio) / 1000.0  # Convert to seconds
-        
-        # Calculate duration for each phrase and add it to the phrase object
-        def timestamp_to_seconds(ts: str) -> float:
-            """Convert timestamp string to seconds."""
-            parts = ts.split(':')
-            if len(parts) == 4:  # HH:MM:SS:mmm
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2]) + float(parts[3]) / 1000.0
-            elif len(parts) == 3:  # H:MM:SS.mmm
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-            elif len(parts) == 2:  # MM:SS.mmm
-                return float(parts[0]) * 60 + float(parts[1])
-            return float(ts)
-        
-        # Add duration to each phrase
-        processed_phrases = []
+        # Add duration to each phrase (in place, transcription_data is not reused)
         for phrase in transcription_data:
-            start_time = phrase.get('start', '00:00:00:000')
-            end_time = phrase.get('end', '00:00:00:000')
-            
-            start_seconds = timestamp_to_seconds(start_time)
-            end_seconds = timestamp_to_seconds(end_time)
-            duration = end_seconds - start_seconds
-            
-            # Add duration field to phrase
-            phrase_with_duration = phrase.copy()
-            phrase_with_duration['duration'] = duration
-            processed_phrases.append(phrase_with_duration)
+            start_seconds = timestamp_to_seconds(phrase.get('start', '00:00:00:000'))
+            end_seconds = timestamp_to_seconds(phrase.get('end', '00:00:00:000'))
+            phrase['duration'] = end_seconds - start_seconds
+        processed_phrases = transcription_data
         
         # Prepare simplified response
         response_data = {
@@ -846,17 +983,15 @@ def transcribe_phrases():
         if reference_text:
             response_data['reference_text'] = reference_text
         
-        print(f"✅ Transcription completed: {len(transcription_data)} phrases")
+        logger.info(f"✅ Transcription completed: {len(transcription_data)} phrases")
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data': response_data
         })
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error during transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error during transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -881,24 +1016,24 @@ def save_to_database():
         - X-User-ID: User ID (optional, alternative to JSON body)
     """
     try:
-        data = request.get_json()
+        data, error = decode_request(SaveToDatabaseRequest)
         
-        if not data:
+        if error:
             return jsonify({
                 'success': False,
-                'error': 'No data provided'
+                'error': error
             }), 400
         
         # Get user_id from request body or headers (optional)
-        user_id = data.get('user_id') or request.headers.get('X-User-ID') or 'anonymous'
+        user_id = data.user_id or request.headers.get('X-User-ID') or 'anonymous'
         
         # Extract audio filename from audio_path or use provided filename
-        audio_path = data.get('audio_path', '')
-        audio_filename = data.get('audio_filename', '')
+        audio_path = data.audio_path
+        audio_filename = data.audio_filename
         
         # Parse audio filename from path if needed
         if audio_path and not audio_filename:
-            # Extract filename from path like "/api/audio/1234567890_filename.mp3"
+            # Extract filename from path like "/api/audio/3f9c2a1b7e4d_filename.mp3"
             audio_filename = audio_path.split('/')[-1] if '/' in audio_path else audio_path
         
         if not audio_filename:
@@ -907,33 +1042,42 @@ def save_to_database():
                 'error': 'Audio filename is required'
             }), 400
         
-        # Get local audio file path
-        local_audio_path = os.path.join(AUDIO_FOLDER, audio_filename)
-        
-        if not os.path.exists(local_audio_path):
+        # Get local audio file path (a single stat call doubles as the existence check)
+        local_audio_path = AUDIO_FOLDER_PATH / audio_filename
+        try:
+            local_audio_path.stat()
+        except FileNotFoundError:
             return jsonify({
                 'success': False,
                 'error': f'Audio file not found: {audio_filename}'
             }), 404
         
         # Get transcription data
-        transcription_data = data.get('transcription_data')
+        transcription_data = data.transcription_data
         if not transcription_data:
             return jsonify({
                 'success': False,
                 'error': 'Transcription data is required'
             }), 400
         
+        # Fail fast on malformed payloads before paying for the S3 upload
+        validation_error = validate_transcription_data(transcription_data)
+        if validation_error:
+            return jsonify({
+                'success': False,
+                'error': validation_error
+            }), 400
+        
         # Save to S3 and MongoDB (user_id is optional, defaults to 'anonymous')
         result = storage_manager.save_transcription(
-            local_audio_path=local_audio_path,
+            local_audio_path=str(local_audio_path),
             transcription_data=transcription_data,
             original_filename=audio_filename,
             user_id=user_id or 'anonymous'
         )
         
         if result['success']:
-            print(f"💾 Saved transcription to database: {result.get('mongodb_id')}")
+            logger.info(f"💾 Saved transcription to database: {result.get('mongodb_id')}")
             return jsonify({
                 'success': True,
                 'message': result.get('message', 'Data saved successfully'),
@@ -947,9 +1091,7 @@ def save_to_database():
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error saving to database: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error saving to database: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -972,10 +1114,12 @@ def list_transcriptions():
     Query Parameters:
         - limit: Maximum number of results (default: 100)
         - skip: Number of results to skip (default: 0)
+        - summary: '1' to skip loading word/phrase arrays (edited_words_count is then null)
     """
     try:
         limit = int(request.args.get('limit', 100))
         skip = int(request.args.get('skip', 0))
+        projection = SUMMARY_PROJECTION if request.args.get('summary') == '1' else None
         
         # Get user info from headers
         user_id, is_admin = get_user_from_request()
@@ -991,11 +1135,12 @@ def list_transcriptions():
             limit=limit, 
             skip=skip, 
             user_id=user_id, 
-            is_admin=is_admin
+            is_admin=is_admin,
+            projection=projection
         )
         
         if result['success']:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'data': result
             })
@@ -1006,9 +1151,7 @@ def list_transcriptions():
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error listing transcriptions: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error listing transcriptions: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1045,7 +1188,7 @@ def get_transcription_by_id(transcription_id):
         )
         
         if document:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'data': document
             })
@@ -1056,9 +1199,7 @@ def get_transcription_by_id(transcription_id):
             }), 404
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error getting transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error getting transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1076,16 +1217,16 @@ def update_transcription_by_id(transcription_id):
         - user_id: (optional) User ID to mark who saved the changes
     """
     try:
-        data = request.get_json()
+        data, error = decode_request(UpdateTranscriptionRequest)
         
-        if not data or 'transcription_data' not in data:
+        if error:
             return jsonify({
                 'success': False,
-                'error': 'transcription_data is required'
+                'error': error
             }), 400
         
-        transcription_data = data['transcription_data']
-        user_id = data.get('user_id')  # Get user_id from request
+        transcription_data = data.transcription_data
+        user_id = data.user_id  # Get user_id from request
         
         result = storage_manager.update_transcription(transcription_id, transcription_data, user_id=user_id)
         
@@ -1102,9 +1243,7 @@ def update_transcription_by_id(transcription_id):
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error updating transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error updating transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1149,9 +1288,7 @@ def flag_transcription(transcription_id):
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error flagging transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error flagging transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1160,6 +1297,7 @@ def flag_transcription(transcription_id):
 
 
 @app.route('/api/admin/transcriptions/<transcription_id>/assign', methods=['POST'])
+@requires_admin
 def assign_transcription(transcription_id):
     """
     Assign a transcription to a user (admin only).
@@ -1171,16 +1309,16 @@ def assign_transcription(transcription_id):
         - assigned_user_id: User ID to assign the transcription to
     """
     try:
-        print(f"📝 Assign transcription endpoint called: transcription_id={transcription_id}")
+        logger.info(f"📝 Assign transcription endpoint called: transcription_id={transcription_id}")
         
-        # Check if user is admin
-        _, is_admin = get_user_from_request()
-        if not is_admin:
-            print("❌ Admin access denied")
+        # Parse the transcription id once, before any database work
+        try:
+            transcription_obj_id = ObjectId(transcription_id)
+        except (InvalidId, TypeError):
             return jsonify({
                 'success': False,
-                'error': 'Admin access required'
-            }), 403
+                'error': 'Invalid transcription ID format'
+            }), 400
         
         data = request.get_json()
         if not data or 'assigned_user_id' not in data:
@@ -1190,51 +1328,33 @@ def assign_transcription(transcription_id):
             }), 400
         
         assigned_user_id = data['assigned_user_id']
-        print(f"📝 Assigning to user: {assigned_user_id}")
+        logger.info(f"📝 Assigning to user: {assigned_user_id}")
         
         # Verify user exists
         if users_collection:
-            from bson import ObjectId
-            from bson.errors import InvalidId
-            
-            # Try to find user by ObjectId first
+            # Match by username, or by ObjectId when the value parses as one (single round-trip)
+            or_clauses = [{'username': assigned_user_id}]
             try:
-                user_obj_id = ObjectId(assigned_user_id)
-                user = users_collection.find_one({'_id': user_obj_id})
-            except (InvalidId, ValueError):
-                user = None
-            
-            # If not found by ObjectId, try by username
-            if not user:
-                user = users_collection.find_one({'username': assigned_user_id})
+                or_clauses.append({'_id': ObjectId(assigned_user_id)})
+            except (InvalidId, TypeError):
+                pass
+            user = users_collection.find_one({'$or': or_clauses}, projection={'_id': 1})
             
             if not user:
-                print(f"❌ User not found: {assigned_user_id}")
+                logger.warning(f"❌ User not found: {assigned_user_id}")
                 return jsonify({
                     'success': False,
                     'error': 'User not found'
                 }), 404
             
             assigned_user_id = str(user['_id'])
-            print(f"✅ Found user: {assigned_user_id}")
+            logger.info(f"✅ Found user: {assigned_user_id}")
         
-        result = storage_manager.assign_transcription(transcription_id, assigned_user_id)
+        result = storage_manager.assign_transcription(transcription_obj_id, assigned_user_id)
         
         if result['success']:
             assigned_id = result.get('assigned_user_id')
-            print(f"✅ Successfully assigned transcription {transcription_id} to user {assigned_id}")
-            
-            # Verify the assignment in the database
-            from bson import ObjectId
-            try:
-                doc = storage_manager.collection.find_one({'_id': ObjectId(transcription_id)})
-                if doc:
-                    saved_assigned = doc.get('assigned_user_id')
-                    print(f"   Database verification: assigned_user_id = {saved_assigned}")
-                    if str(saved_assigned) != str(assigned_id):
-                        print(f"   ⚠️  Warning: Mismatch! Expected {assigned_id}, found {saved_assigned}")
-            except Exception as verify_error:
-                print(f"   ⚠️  Could not verify assignment: {verify_error}")
+            logger.info(f"✅ Successfully assigned transcription {transcription_id} to user {assigned_id}")
             
             return jsonify({
                 'success': True,
@@ -1243,16 +1363,14 @@ def assign_transcription(transcription_id):
                 'assigned_user_id': assigned_id
             })
         else:
-            print(f"❌ Failed to assign: {result.get('error')}")
+            logger.error(f"❌ Failed to assign: {result.get('error')}")
             return jsonify({
                 'success': False,
                 'error': result.get('error', 'Failed to assign transcription')
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error assigning transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error assigning transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1261,6 +1379,7 @@ def assign_transcription(transcription_id):
 
 
 @app.route('/api/admin/transcriptions/<transcription_id>/unassign', methods=['POST'])
+@requires_admin
 def unassign_transcription(transcription_id):
     """
     Unassign a transcription (admin only).
@@ -1269,36 +1388,26 @@ def unassign_transcription(transcription_id):
         - X-Is-Admin: 'true' (required)
     """
     try:
-        print(f"📝 Unassign transcription endpoint called: transcription_id={transcription_id}")
-        
-        # Check if user is admin
-        _, is_admin = get_user_from_request()
-        if not is_admin:
-            return jsonify({
-                'success': False,
-                'error': 'Admin access required'
-            }), 403
+        logger.info(f"📝 Unassign transcription endpoint called: transcription_id={transcription_id}")
         
         result = storage_manager.unassign_transcription(transcription_id)
         
         if result['success']:
-            print(f"✅ Successfully unassigned transcription {transcription_id}")
+            logger.info(f"✅ Successfully unassigned transcription {transcription_id}")
             return jsonify({
                 'success': True,
                 'message': result.get('message', 'Transcription unassigned successfully'),
                 'document_id': result.get('document_id')
             })
         else:
-            print(f"❌ Failed to unassign: {result.get('error')}")
+            logger.error(f"❌ Failed to unassign: {result.get('error')}")
             return jsonify({
                 'success': False,
                 'error': result.get('error', 'Failed to unassign transcription')
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error unassigning transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error unassigning transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1307,6 +1416,7 @@ def unassign_transcription(transcription_id):
 
 
 @app.route('/api/transcriptions/<transcription_id>', methods=['DELETE'])
+@requires_admin
 def delete_transcription_by_id(transcription_id):
     """
     Delete a transcription from MongoDB (admin only).
@@ -1315,14 +1425,6 @@ def delete_transcription_by_id(transcription_id):
         - X-Is-Admin: 'true' (required)
     """
     try:
-        # Check if user is admin
-        _, is_admin = get_user_from_request()
-        if not is_admin:
-            return jsonify({
-                'success': False,
-                'error': 'Admin access required'
-            }), 403
-        
         result = storage_manager.delete_transcription(transcription_id)
         
         if result['success']:
@@ -1338,9 +1440,7 @@ def delete_transcription_by_id(transcription_id):
             }), 500
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error deleting transcription: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error deleting transcription: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1349,6 +1449,7 @@ def delete_transcription_by_id(transcription_id):
 
 
 @app.route('/api/admin/users', methods=['GET'])
+@requires_admin
 def list_users():
     """
     List all users (admin only).
@@ -1357,40 +1458,22 @@ def list_users():
         - X-Is-Admin: 'true' (required)
     """
     try:
-        # Check if user is admin
-        _, is_admin = get_user_from_request()
-        if not is_admin:
-            return jsonify({
-                'success': False,
-                'error': 'Admin access required'
-            }), 403
-        
         if not users_collection:
             return jsonify({
                 'success': False,
                 'error': 'User service unavailable'
             }), 500
         
-        users = []
-        for user in users_collection.find({}, {'password_hash': 0}):  # Exclude password
-            user['_id'] = str(user['_id'])
-            if 'created_at' in user and isinstance(user['created_at'], datetime):
-                user['created_at'] = user['created_at'].isoformat()
-            if 'updated_at' in user and isinstance(user['updated_at'], datetime):
-                user['updated_at'] = user['updated_at'].isoformat()
-            if 'last_login' in user and isinstance(user['last_login'], datetime):
-                user['last_login'] = user['last_login'].isoformat()
-            users.append(user)
+        users = list(users_collection.find({}, {'password_hash': 0}))  # Exclude password
         
-        return jsonify({
+        # orjson encodes datetimes natively (Mongo returns naive UTC) and ObjectId via str()
+        return ojsonify({
             'success': True,
             'users': users
-        })
+        }, option=orjson.OPT_NAIVE_UTC)
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error listing users: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error listing users: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1399,6 +1482,7 @@ def list_users():
 
 
 @app.route('/api/admin/transcriptions/download-done', methods=['GET'])
+@requires_admin
 def download_done_transcriptions():
     """
     Download all transcriptions with status 'done' as a zip file (admin only).
@@ -1410,14 +1494,6 @@ def download_done_transcriptions():
         ZIP file containing all JSON transcription files for 'done' transcriptions
     """
     try:
-        # Check if user is admin
-        _, is_admin = get_user_from_request()
-        if not is_admin:
-            return jsonify({
-                'success': False,
-                'error': 'Admin access required'
-            }), 403
-        
         if not storage_manager.collection:
             return jsonify({
                 'success': False,
@@ -1487,7 +1563,6 @@ def download_done_transcriptions():
             }
             """
             # Get MongoDB document ID and convert to timestamp (milliseconds since epoch)
-            from bson import ObjectId
             doc_id = doc.get('_id')
             if isinstance(doc_id, ObjectId):
                 # ObjectId contains timestamp in first 4 bytes (seconds since epoch)
@@ -1567,9 +1642,7 @@ def download_done_transcriptions():
                     count += 1
                     
                 except Exception as e:
-                    print(f"⚠️  Error processing transcription {doc.get('_id')}: {str(e)}")
-                    import traceback
-                    print(traceback.format_exc())
+                    logger.warning(f"⚠️  Error processing transcription {doc.get('_id')}: {str(e)}", exc_info=True)
                     continue
         
         if count == 0:
@@ -1583,7 +1656,7 @@ def download_done_transcriptions():
         timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
         zip_filename = f"done_transcriptions_{timestamp}.zip"
         
-        print(f"✅ Created zip file with {count} transcription(s): {zip_filename}")
+        logger.info(f"✅ Created zip file with {count} transcription(s): {zip_filename}")
         
         return send_file(
             zip_buffer,
@@ -1593,9 +1666,7 @@ def download_done_transcriptions():
         )
     
     except Exception as e:
-        error_trace = traceback.format_exc()
-        print(f"❌ Error downloading done transcriptions: {str(e)}")
-        print(error_trace)
+        logger.exception(f"❌ Error downloading done transcriptions: {str(e)}")
         
         return jsonify({
             'success': False,
@@ -1622,6 +1693,10 @@ def internal_server_error(error):
 
 
 if __name__ == '__main__':
+    if os.getenv('FLASK_ENV') == 'production':
+        # The dev server is not for production; serve.py execs gunicorn before this module is imported
+        sys.exit("❌ FLASK_ENV=production: start the API with python backend/serve.py")
+    
     print("\n" + "="*100)
     print("🚀 Starting Audio Transcription Backend API")
     print("="*100)
@@ -1654,13 +1729,10 @@ if __name__ == '__main__':
     print("="*100 + "\n")
     
     # Run server
-    import os
-    debug_mode = os.getenv('FLASK_ENV') != 'production'
     port = int(os.getenv('FLASK_PORT', '5002'))  # Default to 5002 (available port in 5000-8000 range)
     app.run(
         host='0.0.0.0',
         port=port,
-        debug=debug_mode,
-        threaded=True
+        debug=True
     )
 
@@ -14,21 +14,23 @@ Features:
 - End-of-speech detection
 """
 
+import asyncio
 import os
-import json
 import time
+from functools import lru_cache
 from pathlib import Path
 import re
 import random
 from typing import Optional, Dict, List
 
+import numpy as np
+import orjson
 from vertexai.generative_models import GenerativeModel, Part, GenerationConfig
 from vertexai.preview.generative_models import SafetySetting
-from pydub import AudioSegment
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from utils.file_utils import ensure_dir, save_json
 from utils.audio_splitter import split_audio
+from utils.audio_utils import get_audio_duration
 from pipeline.pipeline_config import GOOGLE_APPLICATION_CREDENTIALS
 
 # Set Google credentials for authentication
@@ -37,198 +39,38 @@ os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
 # Configuration
 AUDIO_CHUNKING_OFFSET = 300  # 5 minutes chunks
 MODEL_NAME = "gemini-2.5-flash"
+# Chunk requests are network-bound, so several can be in flight at once (bounded by Vertex AI quota)
+TRANSCRIBE_WORKERS = int(os.getenv('BENGALI_TRANSCRIBE_WORKERS', '4'))
 
+# Patterns used to pull the JSON array out of model responses
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)```', re.DOTALL)
+_JSON_BLOCK_OPEN_RE = re.compile(r'```json\s*(.*)', re.DOTALL)  # Truncated response (no closing backticks)
+_TRAILING_COMMA_RE = re.compile(r',\s*([\]}])')
+_REQUIRED_FIELDS = frozenset(("start", "end", "text", "speaker", "language", "emotion", "end_of_speech"))
 
-def retry_with_backoff(func, max_retries=5, base_delay=15.0, max_delay=300.0, *args, **kwargs):
-    """Retry a function with exponential backoff."""
-    for attempt in range(max_retries):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            if attempt == max_retries - 1:
-                raise
-            delay = min(max_delay, base_delay * (2 ** attempt))
-            jitter = random.uniform(0, delay * 0.1)
-            total_delay = delay + jitter
-            print(f"⚠️ Attempt {attempt + 1} failed: {str(e)}. Retrying in {total_delay:.1f}s...")
-            time.sleep(total_delay)
-
-
-def timestamp_to_seconds(timestamp: str) -> float:
-    """Convert timestamp string like 'HH:MM:SS:mmm' to seconds."""
-    parts = timestamp.split(":")
-    if len(parts) == 4:  # HH:MM:SS:mmm
-        hours, minutes, seconds, milliseconds = parts
-        return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(milliseconds) / 1000.0
-    elif len(parts) == 3:  # H:MM:SS or MM:SS.mmm (legacy support)
-        # Check if last part contains a decimal point
-        if '.' in parts[2]:
-            # Legacy MM:SS.mmm format
-            minutes, seconds = parts[1], parts[2]
-            return int(parts[0]) * 3600 + int(minutes) * 60 + float(seconds)
-        else:
-            # HH:MM:SS format without milliseconds
-            hours, minutes, seconds = parts
-            return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-    else:  # MM:SS.mmm (legacy)
-        minutes, seconds = parts
-        return int(minutes) * 60 + float(seconds)
-
-
-def seconds_to_timestamp(seconds: float) -> str:
-    """Convert seconds to timestamp string like 'HH:MM:SS:mmm'."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}:{milliseconds:03d}"
-
-
-def deduplicate_entries(items: List[Dict]) -> List[Dict]:
-    """Remove duplicate entries with the same timestamps."""
-    seen = set()
-    deduplicated = []
-    
-    for item in items:
-        key = (item.get('start'), item.get('end'))
-        if key not in seen:
-            seen.add(key)
-            deduplicated.append(item)
-    
-    return deduplicated
-
+# Bengali Unicode block: U+0980 to U+09FF
+_BENGALI_RE = re.compile('[\u0980-\u09FF]')
 
-def has_bengali_script(text: str) -> bool:
-    """Check if text contains Bengali script."""
-    # Bengali Unicode range: U+0980 to U+09FF
-    return any('\u0980' <= char <= '\u09FF' for char in text)
+# printf-style formatting of padded ints is cheaper than the equivalent f-string format specs
+_TIMESTAMP_FMT = "%02d:%02d:%02d:%03d"
 
 
-def validate_script_usage(items: List[Dict]) -> List[str]:
-    """
-    Validate that transcription uses Bengali script properly.
-    Warns if inconsistencies are found.
-    """
-    warnings = []
-    
-    for i, item in enumerate(items):
-        text = item.get('text', '')
-        language = item.get('language', '')
-        
-        has_bengali = has_bengali_script(text)
-        
-        # Check if Bengali text is present
-        if language == 'BEN':
-            if not has_bengali:
-                warnings.append(
-                    f"Segment {i+1}: Tagged as BEN but no Bengali script found - \"{text[:50]}...\""
-                )
-    
-    if warnings:
-        print(f"\n⚠️ Script Validation Warnings ({len(warnings)} found):")
-        for warning in warnings[:10]:  # Show first 10 warnings
-            print(f"   {warning}")
-        if len(warnings) > 10:
-            print(f"   ... and {len(warnings) - 10} more warnings")
-        print()
-    else:
-        print("✅ Script validation passed: All segments use Bengali script properly")
-    
-    return warnings
-
-
-def safe_extract_json(content: str) -> List[Dict]:
-    """Extract and parse JSON from model response."""
-    # Try to find JSON block
-    json_match = re.search(r'```json\s*(.*?)```', content, re.DOTALL)
-    
-    if not json_match:
-        # Try without closing backticks (truncated response)
-        json_match = re.search(r'```json\s*(.*)', content, re.DOTALL)
-        if not json_match:
-            raise ValueError("No JSON block found in content.")
-    
-    json_str = json_match.group(1).strip()
-    
-    # Handle incomplete JSON
-    if not json_str.endswith(']'):
-        last_complete = json_str.rfind('}')
-        if last_complete != -1:
-            json_str = json_str[:last_complete + 1]
-            if not json_str.endswith(']'):
-                json_str += '\n]'
-    
-    # Ensure proper JSON array format
-    if not (json_str.startswith('[') and json_str.endswith(']')):
-        json_str = f"[{json_str}]"
-    
-    # Remove trailing commas
-    json_str = re.sub(r',\s*([\]}])', r'\1', json_str)
-    
-    try:
-        json_data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON parsing error: {e}")
-        raise ValueError(f"Failed to parse JSON: {e}")
-    
-    # Validate and clean data
-    valid_items = []
-    for item in json_data:
-        required_fields = ["start", "end", "text", "speaker", "language", "emotion", "end_of_speech"]
-        if not all(k in item for k in required_fields):
-            print(f"⚠️ Warning: Skipping invalid item (missing fields): {item}")
-            continue
-        valid_items.append(item)
-    
-    if not valid_items:
-        raise ValueError("No valid items found in JSON data")
-    
-    return deduplicate_entries(valid_items)
+@lru_cache(maxsize=1)
+def _get_model() -> GenerativeModel:
+    """Build the Gemini model on first use (the constructor resolves GCP credentials/project)."""
+    return GenerativeModel(MODEL_NAME)
 
 
-def merge_json_with_offset(data: Dict[int, List[Dict]], time_offset: int) -> List[Dict]:
-    """
-    Merge multiple JSON arrays and apply time offset for each chunk.
-    
-    Args:
-        data: Dictionary where keys are chunk indices and values are JSON arrays
-        time_offset: Time in seconds to offset for each chunk
-    
-    Returns:
-        Merged and time-adjusted JSON array
-    """
-    merged_array = []
-    sorted_data = sorted(data.items(), key=lambda x: x[0])
-    
-    for i, json_array in sorted_data:
-        offset_seconds = i * time_offset
-        for entry in json_array:
-            new_entry = entry.copy()
-            new_entry['start'] = seconds_to_timestamp(
-                timestamp_to_seconds(entry['start']) + offset_seconds
-            )
-            new_entry['end'] = seconds_to_timestamp(
-                timestamp_to_seconds(entry['end']) + offset_seconds
-            )
-            merged_array.append(new_entry)
-    
-    return merged_array
+# Shared across chunks: safety settings, generation config and the (static) transcription prompt
 
+_SAFETY_SETTINGS = [
+    SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
+    SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
+    SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
+    SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
+]
 
-def transcribe_chunk_bengali(idx: int, chunk_path: str) -> tuple:
-    """
-    Transcribe a single audio chunk for Bengali with speaker identification.
-    
-    Args:
-        idx: Chunk index
-        chunk_path: Path to audio chunk file
-    
-    Returns:
-        Tuple of (index, transcription_data)
-    """
-    model = GenerativeModel(MODEL_NAME)
-    
-    prompt = """
+_PROMPT = """
     ============================================================================
     BENGALI AUDIO TRANSCRIPTION - INSTRUCTIONS
     ============================================================================
@@ -503,42 +345,324 @@ def transcribe_chunk_bengali(idx: int, chunk_path: str) -> tuple:
     - Proper language tags (BEN)
     ============================================================================
     """
+
+_PROMPT_PART = Part.from_text(_PROMPT)
+
+_GEN_CONFIG = GenerationConfig(
+    audio_timestamp=True,
+    max_output_tokens=8192,
+    temperature=0.05  # Very low temperature for strict instruction following
+)
+
+
+def retry_with_backoff(func, max_retries=5, base_delay=15.0, max_delay=300.0, *args, **kwargs):
+    """Retry a function with exponential backoff."""
+    for attempt in range(max_retries):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            jitter = random.uniform(0, delay * 0.1)
+            total_delay = delay + jitter
+            print(f"⚠️ Attempt {attempt + 1} failed: {str(e)}. Retrying in {total_delay:.1f}s...")
+            time.sleep(total_delay)
+
+
+async def async_retry_with_backoff(func, max_retries=5, base_delay=15.0, max_delay=300.0, *args, **kwargs):
+    """Retry a coroutine function with exponential backoff without blocking the event loop."""
+    for attempt in range(max_retries):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            jitter = random.uniform(0, delay * 0.1)
+            total_delay = delay + jitter
+            print(f"⚠️ Attempt {attempt + 1} failed: {str(e)}. Retrying in {total_delay:.1f}s...")
+            await asyncio.sleep(total_delay)
+
+
+def timestamp_to_seconds(timestamp: str) -> float:
+    """Convert timestamp string like 'HH:MM:SS:mmm' to seconds."""
+    parts = timestamp.split(":")
+    if len(parts) == 4:  # HH:MM:SS:mmm
+        hours, minutes, seconds, milliseconds = parts
+        return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(milliseconds) / 1000.0
+    elif len(parts) == 3:  # H:MM:SS or MM:SS.mmm (legacy support)
+        # Check if last part contains a decimal point
+        if '.' in parts[2]:
+            # Legacy MM:SS.mmm format
+            minutes, seconds = parts[1], parts[2]
+            return int(parts[0]) * 3600 + int(minutes) * 60 + float(seconds)
+        else:
+            # HH:MM:SS format without milliseconds
+            hours, minutes, seconds = parts
+            return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    else:  # MM:SS.mmm (legacy)
+        minutes, seconds = parts
+        return int(minutes) * 60 + float(seconds)
+
+
+def timestamp_to_ms(timestamp: str) -> int:
+    """Convert timestamp string like 'HH:MM:SS:mmm' to integer milliseconds."""
+    parts = timestamp.split(":")
+    if len(parts) == 4 and '.' not in parts[2]:
+        hours, minutes, seconds, milliseconds = parts
+        return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(milliseconds)
+    # Legacy formats go through the float parser
+    return round(timestamp_to_seconds(timestamp) * 1000)
+
+
+def format_ms_array(ms: np.ndarray) -> List[str]:
+    """Format an array of millisecond offsets as 'HH:MM:SS:mmm' strings."""
+    hours, rem = np.divmod(ms, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, millis = np.divmod(rem, 1000)
+    fmt = _TIMESTAMP_FMT
+    return [fmt % parts for parts in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())]
+
+
+def deduplicate_entries(items: List[Dict]) -> List[Dict]:
+    """
+    Remove duplicate entries with the same timestamps.
     
-    with open(chunk_path, "rb") as af:
-        audio_file = Part.from_data(af.read(), mime_type="audio/mpeg")
+    Items arrive in chronological order, so a repeated segment is always adjacent
+    to its original and only the previous key needs to be remembered.
+    """
+    prev_key = None
+    deduplicated = []
     
-    safety_settings = [
-        SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
-        SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
-        SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
-        SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
-    ]
+    for item in items:
+        key = (item.get('start'), item.get('end'))
+        if key != prev_key:
+            deduplicated.append(item)
+            prev_key = key
     
-    def call_model():
-        config = GenerationConfig(
-            audio_timestamp=True,
-            max_output_tokens=8192,
-            temperature=0.05  # Very low temperature for strict instruction following
-        )
-        return model.generate_content(
-            [audio_file, prompt],
-            generation_config=config,
-            safety_settings=safety_settings
-        )
+    return deduplicated
+
+
+def has_bengali_script(text: str) -> bool:
+    """Check if text contains Bengali script."""
+    return _BENGALI_RE.search(text) is not None
+
+
+def validate_script_usage(items: List[Dict]) -> List[str]:
+    """
+    Validate that transcription uses Bengali script properly.
+    Warns if inconsistencies are found.
+    """
+    warnings = []
     
-    print(f"🎤 Processing chunk {idx}...")
-    response = retry_with_backoff(call_model)
+    for i, item in enumerate(items):
+        text = item.get('text', '')
+        language = item.get('language', '')
+        
+        has_bengali = has_bengali_script(text)
+        
+        # Check if Bengali text is present
+        if language == 'BEN':
+            if not has_bengali:
+                warnings.append(
+                    f"Segment {i+1}: Tagged as BEN but no Bengali script found - \"{text[:50]}...\""
+                )
+    
+    if warnings:
+        print(f"\n⚠️ Script Validation Warnings ({len(warnings)} found):")
+        for warning in warnings[:10]:  # Show first 10 warnings
+            print(f"   {warning}")
+        if len(warnings) > 10:
+            print(f"   ... and {len(warnings) - 10} more warnings")
+        print()
+    else:
+        print("✅ Script validation passed: All segments use Bengali script properly")
     
+    return warnings
+
+
+def safe_extract_json(content: str) -> List[Dict]:
+    """Extract and parse JSON from model response."""
+    # Try to find JSON block
+    json_match = _JSON_BLOCK_RE.search(content)
+    
+    if not json_match:
+        # Try without closing backticks (truncated response)
+        json_match = _JSON_BLOCK_OPEN_RE.search(content)
+        if not json_match:
+            raise ValueError("No JSON block found in content.")
+    
+    json_str = json_match.group(1).strip()
+    
+    # Handle incomplete JSON
+    if not json_str.endswith(']'):
+        last_complete = json_str.rfind('}')
+        if last_complete != -1:
+            json_str = json_str[:last_complete + 1]
+            if not json_str.endswith(']'):
+                json_str += '\n]'
+    
+    # Ensure proper JSON array format
+    if not (json_str.startswith('[') and json_str.endswith(']')):
+        json_str = f"[{json_str}]"
+    
+    try:
+        json_data = orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        # Remove trailing commas only when the response actually fails to parse
+        try:
+            json_data = orjson.loads(_TRAILING_COMMA_RE.sub(r'\1', json_str))
+        except orjson.JSONDecodeError as e:
+            print(f"❌ JSON parsing error: {e}")
+            raise ValueError(f"Failed to parse JSON: {e}")
+    
+    # Validate and clean data
+    valid_items = []
+    for item in json_data:
+        if not _REQUIRED_FIELDS <= item.keys():
+            print(f"⚠️ Warning: Skipping invalid item (missing fields): {item}")
+            continue
+        valid_items.append(item)
+    
+    if not valid_items:
+        raise ValueError("No valid items found in JSON data")
+    
+    return deduplicate_entries(valid_items)
+
+
+def merge_json_with_offset(data: Dict[int, List[Dict]], time_offset: int) -> List[Dict]:
+    """
+    Merge multiple JSON arrays and apply time offset for each chunk.
+    
+    Args:
+        data: Dictionary where keys are chunk indices and values are JSON arrays
+        time_offset: Time in seconds to offset for each chunk
+    
+    Returns:
+        Merged and time-adjusted JSON array
+    """
+    merged_array = []
+    
+    # Chunk indices are dense (0..K-1), so walk them in order instead of sorting
+    for i in range(len(data)):
+        json_array = data[i]
+        if not json_array:
+            continue
+        # Parse once into an interleaved int64 array of [start, end, start, end, ...] milliseconds,
+        # shift the whole chunk with one vector add, then format every timestamp in one pass
+        offset_ms = i * time_offset * 1000
+        bounds_ms = np.fromiter(
+            (timestamp_to_ms(entry[key]) for entry in json_array for key in ('start', 'end')),
+            dtype=np.int64, count=2 * len(json_array)
+        ) + offset_ms
+        formatted = format_ms_array(bounds_ms)
+        
+        # Entries come straight from safe_extract_json and aren't reused, so update them in place
+        for entry, start, end in zip(json_array, formatted[0::2], formatted[1::2]):
+            entry['start'] = start
+            entry['end'] = end
+        merged_array.extend(json_array)
+    
+    return merged_array
+
+
+def _load_audio_part(chunk_path: str) -> Part:
+    """Read an audio chunk into a Gemini Part."""
+    # Part.from_data copies the payload into its protobuf, so the raw bytes are released as
+    # soon as the Part is built and retries reuse the Part rather than re-reading the file
+    with open(chunk_path, "rb") as af:
+        return Part.from_data(af.read(), mime_type="audio/mpeg")
+
+
+def _extract_chunk_segments(idx: int, response) -> List[Dict]:
+    """Check the finish reason of a chunk response and parse its segments."""
     # Check finish reason
-    finish_reason = response.candidates[0].finish_reason
+    candidate = response.candidates[0]
+    finish_reason = candidate.finish_reason
     if finish_reason != 1:
         print(f"⚠️ Warning: Response may be incomplete. Finish reason: {finish_reason}")
     
-    content = response.candidates[0].content.text
+    content = candidate.content.text
     json_data = safe_extract_json(content)
     
     print(f"✅ Chunk {idx} completed: {len(json_data)} segments transcribed")
-    return idx, json_data
+    return json_data
+
+
+def transcribe_chunk_bengali(idx: int, chunk_path: str) -> tuple:
+    """
+    Transcribe a single audio chunk for Bengali with speaker identification.
+    
+    Args:
+        idx: Chunk index
+        chunk_path: Path to audio chunk file
+    
+    Returns:
+        Tuple of (index, transcription_data)
+    """
+    audio_file = _load_audio_part(chunk_path)
+    
+    def call_model():
+        return _get_model().generate_content(
+            [audio_file, _PROMPT_PART],
+            generation_config=_GEN_CONFIG,
+            safety_settings=_SAFETY_SETTINGS
+        )
+    
+    print(f"🎤 Processing chunk {idx}...")
+    response = retry_with_backoff(call_model)
+    return idx, _extract_chunk_segments(idx, response)
+
+
+async def transcribe_chunk_bengali_async(idx: int, chunk_path: str, semaphore: asyncio.Semaphore,
+                                         model: GenerativeModel) -> tuple:
+    """
+    Transcribe a single audio chunk using the async Vertex AI client.
+    
+    Args:
+        idx: Chunk index
+        chunk_path: Path to audio chunk file
+        semaphore: Limits how many chunk requests are in flight at once
+        model: Model created on the running event loop (its async client is bound to that loop)
+    
+    Returns:
+        Tuple of (index, transcription_data)
+    """
+    async with semaphore:
+        audio_file = await asyncio.to_thread(_load_audio_part, chunk_path)
+        
+        async def call_model():
+            return await model.generate_content_async(
+                [audio_file, _PROMPT_PART],
+                generation_config=_GEN_CONFIG,
+                safety_settings=_SAFETY_SETTINGS
+            )
+        
+        print(f"🎤 Processing chunk {idx}...")
+        response = await async_retry_with_backoff(call_model)
+    
+    return idx, _extract_chunk_segments(idx, response)
+
+
+async def _transcribe_chunks_async(chunks_dict: Dict[int, str]) -> Dict[int, List[Dict]]:
+    """Transcribe all chunks concurrently on one event loop and collect results by index."""
+    semaphore = asyncio.Semaphore(TRANSCRIBE_WORKERS)
+    # The model caches its async gRPC client on the loop that first used it, and each
+    # asyncio.run() call gets a fresh loop, so the shared _get_model() can't be used here
+    model = GenerativeModel(MODEL_NAME)
+    
+    async def run(idx, chunk_path):
+        try:
+            return await transcribe_chunk_bengali_async(idx, chunk_path, semaphore, model)
+        except Exception as e:
+            print(f"❌ Error processing chunk {idx}: {str(e)}")
+            raise
+    
+    completed = await asyncio.gather(
+        *(run(idx, chunk_path) for idx, chunk_path in chunks_dict.items())
+    )
+    return dict(completed)
 
 
 def transcribe_chunks(audio_path: str, duration: float) -> List[Dict]:
@@ -552,24 +676,10 @@ def transcribe_chunks(audio_path: str, duration: float) -> List[Dict]:
     Returns:
         Combined transcription data
     """
-    chunks_dict = split_audio(audio_path)
-    results = {}
-    
-    # Process chunks (can increase max_workers for faster processing)
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future_to_idx = {
-            executor.submit(transcribe_chunk_bengali, idx, chunk_path): idx
-            for idx, chunk_path in chunks_dict.items()
-        }
-        
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                idx, json_data = future.result()
-                results[idx] = json_data
-            except Exception as e:
-                print(f"❌ Error processing chunk {idx}: {str(e)}")
-                raise
+    chunks_dict = split_audio(audio_path, chunk_duration_seconds=AUDIO_CHUNKING_OFFSET)
+    
+    # Process chunks concurrently (async RPCs, bounded by TRANSCRIBE_WORKERS)
+    results = asyncio.run(_transcribe_chunks_async(chunks_dict))
     
     # Merge chunks with time offset
     final_json = merge_json_with_offset(results, AUDIO_CHUNKING_OFFSET)
@@ -601,8 +711,7 @@ def transcribe_bengali_audio(audio_path: str, output_json: str) -> List[Dict]:
     
     # Get audio duration
     print("📊 Analyzing audio file...")
-    audio = AudioSegment.from_file(audio_path)
-    audio_duration = len(audio) / 1000.0  # Convert to seconds
+    audio_duration = get_audio_duration(audio_path)
     print(f"⏱️  Audio Duration: {audio_duration:.2f} seconds ({audio_duration/60:.2f} minutes)")
     
     # Transcribe
@@ -665,38 +774,36 @@ def analyze_transcription(json_path: str):
     Args:
         json_path: Path to the transcription JSON file
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        transcription = json.load(f)
-    
-    # Language statistics
-    ben_segments = [s for s in transcription if s.get('language') == 'BEN']
+    with open(json_path, 'rb') as f:
+        transcription = orjson.loads(f.read())
     
-    # Script usage statistics
-    bengali_script_segments = [s for s in transcription if has_bengali_script(s.get('text', ''))]
-    
-    # Emotion statistics
+    # Collect language, script, emotion and speaker statistics in a single pass
+    ben_segments_count = 0
+    bengali_script_count = 0
     emotion_stats = {}
+    speaker_stats = {}
     for segment in transcription:
+        lang = segment.get('language', 'Unknown')
+        if lang == 'BEN':
+            ben_segments_count += 1
+        if has_bengali_script(segment.get('text', '')):
+            bengali_script_count += 1
+        
         emotion = segment.get('emotion', 'neutral')
         emotion_stats[emotion] = emotion_stats.get(emotion, 0) + 1
-    
-    # Speaker statistics
-    speaker_stats = {}
-    for segment in transcription:
+        
         speaker = segment.get('speaker', 'Unknown')
-        if speaker not in speaker_stats:
-            speaker_stats[speaker] = {
+        stats = speaker_stats.get(speaker)
+        if stats is None:
+            stats = speaker_stats[speaker] = {
                 'count': 0, 
                 'BEN': 0,
                 'emotions': {}
             }
-        speaker_stats[speaker]['count'] += 1
-        lang = segment.get('language', 'Unknown')
-        if lang in speaker_stats[speaker]:
-            speaker_stats[speaker][lang] += 1
-        
-        emotion = segment.get('emotion', 'neutral')
-        speaker_stats[speaker]['emotions'][emotion] = speaker_stats[speaker]['emotions'].get(emotion, 0) + 1
+        stats['count'] += 1
+        if lang in stats:
+            stats[lang] += 1
+        stats['emotions'][emotion] = stats['emotions'].get(emotion, 0) + 1
     
     print(f"\n{'='*100}")
     print(f"📊 TRANSCRIPTION ANALYSIS")
@@ -704,10 +811,10 @@ def analyze_transcription(json_path: str):
     print(f"📝 Total Segments: {len(transcription)}")
     
     print(f"\n📜 Script Usage Statistics:")
-    print(f"   Bengali Script (বাংলা লিপি): {len(bengali_script_segments)} segments ({len(bengali_script_segments)/len(transcription)*100:.1f}%)")
+    print(f"   Bengali Script (বাংলা লিপি): {bengali_script_count} segments ({bengali_script_count/len(transcription)*100:.1f}%)")
     
     print(f"\n🌐 Language Distribution:")
-    print(f"   Bengali (BEN): {len(ben_segments)} segments ({len(ben_segments)/len(transcription)*100:.1f}%)")
+    print(f"   Bengali (BEN): {ben_segments_count} segments ({ben_segments_count/len(transcription)*100:.1f}%)")
     
     print(f"\n😊 Emotion Distribution:")
     for emotion, count in sorted(emotion_stats.items(), key=lambda x: x[1], reverse=True):
@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for the Audio Transcription Backend API.
+
+Usage (from the project root, with UPLOAD_FOLDER and OUTPUT_FOLDER set):
+    gunicorn -c backend/gunicorn.conf.py backend.backend_api:app
+"""
+import multiprocessing
+import os
+
+# Workers are separate processes: without shared folders each one would get its own temp
+# dir and audio uploaded through one worker would be missing on the others
+_missing = [name for name in ('UPLOAD_FOLDER', 'OUTPUT_FOLDER') if not os.getenv(name)]
+if _missing:
+    raise RuntimeError(f"{', '.join(_missing)} must be set to run under gunicorn")
+
+bind = f"0.0.0.0:{os.getenv('FLASK_PORT', '5002')}"
+
+# gevent workers multiplex many slow requests (S3, MongoDB, Vertex AI) per process
+worker_class = 'gevent'
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+
+# Transcription requests can take several minutes (matches nginx proxy_read_timeout)
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '300'))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_worker_init(worker):
+    """Make grpc (used by Vertex AI) cooperate with the gevent event loop."""
+    import grpc.experimental.gevent as grpc_gevent
+    grpc_gevent.init_gevent()
@@ -1,183 +1,248 @@
+import asyncio
+import hashlib
 import json
+import logging
 import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud import aiplatform
+from google.cloud import storage
+from vertexai.batch_prediction import BatchPredictionJob
 from vertexai.generative_models import GenerativeModel, Part
 import vertexai
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional
 import base64
 
+logger = logging.getLogger(__name__)
+
+# Structured output: Gemini returns a bare JSON array matching this schema
+SEGMENT_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "start_time": {"type": "STRING"},
+            "end_time": {"type": "STRING"},
+            "speaker": {"type": "STRING"},
+            "text": {"type": "STRING"},
+            "emotion": {"type": "STRING"},
+            "language": {"type": "STRING", "enum": ["hindi", "english", "hinglish"]},
+            "end_of_speech": {"type": "BOOLEAN"},
+        },
+        "required": ["start_time", "end_time", "speaker", "text", "emotion", "language", "end_of_speech"],
+    },
+}
+
+MODEL_NAME = "gemini-2.5-flash"
+# Short clips need less diarization/emotion context, so a smaller, faster model is enough
+SHORT_CLIP_MODEL_NAME = "gemini-2.5-flash-lite"
+SHORT_CLIP_SECONDS = 60
+
+GENERATION_CONFIG = {
+    "temperature": 0.2,
+    "top_p": 0.8,
+    "top_k": 40,
+    "max_output_tokens": 8192,
+    "response_mime_type": "application/json",
+    "response_schema": SEGMENT_SCHEMA,
+}
+
+# Upper bound on files transcribed at once by the async multi-file path
+MAX_CONCURRENT_FILES = 16
+
+# Canonical segment timestamp, e.g. "00:00:03:450"
+_TS_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2}):(\d{3})")
+
+_MIME_BY_EXT = {
+    '.mp3': 'audio/mp3',
+    '.wav': 'audio/wav',
+    '.m4a': 'audio/mp4',
+    '.ogg': 'audio/ogg',
+    '.flac': 'audio/flac',
+    '.aac': 'audio/aac'
+}
+
+# Finished transcriptions are cached on disk, keyed by audio content + prompt + model settings:
+# re-running on the same file skips the API call, while any prompt or model change misses
+DEFAULT_CACHE_DIR = os.environ.get('HINGLISH_CACHE_DIR', os.path.expanduser('~/.cache/hinglish'))
+
+# Substrings that mark a JSON file in the working directory as likely GCP credentials
+CREDENTIAL_KEYWORDS = frozenset(('credential', 'key', 'service', 'gcp', 'google'))
+
+# Vertex AI rejects inline request payloads above ~20 MB; larger audio must go through GCS
+INLINE_AUDIO_LIMIT_BYTES = 20 * 1024 * 1024
+
+# Long recordings are split into chunks that are transcribed in parallel; this keeps each
+# response well under max_output_tokens and turns one long call into several shorter ones
+CHUNK_SECONDS = 300
+CHUNK_WORKERS = 8
+# Longest audio sent in one request; beyond this the 8192-token output cap truncates the transcript
+MAX_SINGLE_CALL_SECS = 600
+
+
+def _probe_duration(audio_path: str) -> float:
+    """Read the audio duration in seconds from the container header with ffprobe."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
+        capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip())
+
+
+def _split_audio(audio_path: str, chunk_secs: int, output_dir: str) -> List[str]:
+    """
+    Split audio into consecutive chunks with ffmpeg stream copy (no re-encode)
+    
+    Args:
+        audio_path: Path to the audio file
+        chunk_secs: Length of each chunk in seconds
+        output_dir: Directory to write the chunks to
+        
+    Returns:
+        Chunk file paths, in order
+    """
+    extension = os.path.splitext(audio_path)[1].lower() or '.mp3'
+    list_path = os.path.join(output_dir, 'chunks.txt')
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-y", "-i", audio_path,
+         # Audio only: embedded cover art would otherwise be copied into every chunk
+         "-map", "0:a",
+         "-f", "segment", "-segment_time", str(chunk_secs),
+         "-segment_list", list_path, "-segment_list_type", "flat",
+         "-c", "copy", "-reset_timestamps", "1",
+         os.path.join(output_dir, f"chunk_%03d{extension}")],
+        capture_output=True, check=True
+    )
+    with open(list_path) as f:
+        return [os.path.join(output_dir, line.strip()) for line in f if line.strip()]
+
+
+def _transcode_for_upload(audio_path: str, output_dir: str) -> str:
+    """
+    Re-encode audio to 16 kHz mono Opus before it is sent to Gemini
+    
+    Gemini downsamples speech to 16 kHz mono anyway, so this shrinks the upload several
+    times over without affecting transcription. Files that are already 16 kHz mono, or
+    machines without ffmpeg, use the original file.
+    
+    Args:
+        audio_path: Path to the audio file
+        output_dir: Directory for the transcoded file
+        
+    Returns:
+        Path of the file to upload
+    """
+    try:
+        probe = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=sample_rate,channels", "-of", "csv=p=0", audio_path],
+            capture_output=True, text=True, check=True
+        )
+        if probe.stdout.strip() == "16000,1":
+            return audio_path
+        
+        output_path = os.path.join(output_dir, f"{os.path.splitext(os.path.basename(audio_path))[0]}.ogg")
+        subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-i", audio_path,
+             "-ac", "1", "-ar", "16000", "-c:a", "libopus", "-b:a", "24k", output_path],
+            capture_output=True, check=True
+        )
+        return output_path
+    except (OSError, subprocess.CalledProcessError):
+        return audio_path
+
+
+def _ts_to_ms(timestamp: str, _match=_TS_RE.fullmatch) -> int:
+    """Parse an HH:MM:SS:MS timestamp to milliseconds (missing leading fields count as zero)."""
+    match = _match(timestamp)
+    if match:
+        hours, minutes, seconds, millis = match.groups()
+        return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis)
+    parts = [int(part) for part in timestamp.split(':')]
+    hours, minutes, seconds, millis = [0] * (4 - len(parts)) + parts
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
+
+
+def _shift_timestamp(timestamp: str, offset_ms: int) -> str:
+    """Add offset_ms to an HH:MM:SS:MS timestamp."""
+    total_ms = _ts_to_ms(timestamp) + offset_ms
+    total_secs, millis = divmod(total_ms, 1000)
+    total_mins, seconds = divmod(total_secs, 60)
+    hours, minutes = divmod(total_mins, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{millis:03d}"
+
+
+def _rest_generation_config(config: Dict) -> Dict:
+    """Rename generation config keys to the REST/batch API's camelCase fields (top_p -> topP)."""
+    return {re.sub(r'_([a-z])', lambda m: m.group(1).upper(), key): value for key, value in config.items()}
+
+
+@lru_cache(maxsize=4)
+def _get_model(project_id: str, location: str, model_name: str = MODEL_NAME) -> GenerativeModel:
+    """
+    Initialize Vertex AI and build a Gemini model once per (project, region, model).
+    
+    Args:
+        project_id: Your GCP project ID
+        location: GCP region
+        model_name: Gemini model to use (default: MODEL_NAME)
+        
+    Returns:
+        Shared GenerativeModel instance
+    """
+    vertexai.init(project=project_id, location=location)
+    return GenerativeModel(model_name)
+
+
 class HinglishAudioTranscriber:
-    def __init__(self, project_id: str, location: str = "us-central1"):
+    def __init__(self, project_id: str, location: str = "us-central1", gcs_bucket: Optional[str] = None,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
         """
         Initialize the Hinglish Audio Transcriber with Vertex AI
         
         Args:
             project_id: Your GCP project ID
             location: GCP region (default: us-central1)
+            gcs_bucket: GCS bucket to stage audio in so requests reference it by URI instead of
+                inlining it (default: HINGLISH_GCS_BUCKET environment variable; inline if unset)
+            cache_dir: Directory for cached transcriptions (default: HINGLISH_CACHE_DIR or
+                ~/.cache/hinglish; None or empty disables caching)
         """
         self.project_id = project_id
         self.location = location
+        self.gcs_bucket = gcs_bucket or os.environ.get('HINGLISH_GCS_BUCKET')
+        self.cache_dir = cache_dir or None
+        self._storage_client = None
         
-        # Initialize Vertex AI
-        vertexai.init(project=project_id, location=location)
-        
-        # Initialize the Gemini model
-        self.model = GenerativeModel("gemini-2.5-flash")
-        
-        # Comprehensive system prompt
-        self.system_prompt = """You are an expert audio transcription system specialized in Hinglish (Hindi-English mixed language) speech with multiple speakers.
-
-CRITICAL SCRIPT SEPARATION RULE - THIS IS THE MOST IMPORTANT REQUIREMENT
-
-ABSOLUTE RULE FOR SCRIPT USAGE:
-- If a word is ENGLISH origin → Write in LATIN/ROMAN script ONLY (a-z, A-Z)
-- If a word is HINDI origin → Write in DEVANAGARI script ONLY (अ-ज्ञ)
-- NO EXCEPTIONS. NO TRANSLITERATION. NO MIXING.
-
-FORBIDDEN ACTIONS (WILL RESULT IN FAILURE):
-- NEVER write "टेस्ट" - MUST write "test"
-- NEVER write "स्टूडेंट" - MUST write "student"  
-- NEVER write "स्टैंडर्डाइज्ड" - MUST write "standardized"
-- NEVER write "कैपेबिलिटी" - MUST write "capability"
-- NEVER write "क्वेश्चन" - MUST write "question"
-- NEVER write "पेपर" - MUST write "paper"
-- NEVER write "टाइप" - MUST write "type"
-- NEVER write "फेयर" - MUST write "fair"
-- NEVER write "लर्निंग" - MUST write "learning"
-- NEVER write "स्टाइल" - MUST write "style"
-- NEVER write "थ्योरी" - MUST write "theory"
-- NEVER write "प्रैक्टिकल" - MUST write "practical"
-- NEVER write "प्रेशर" - MUST write "pressure"
-- NEVER write "मार्क्स" - MUST write "marks"
-- NEVER write "इंटेलिजेंट" - MUST write "intelligent"
-- NEVER write "स्किल्स" - MUST write "skills"
-- NEVER write "क्रिएटिविटी" - MUST write "creativity"
-- NEVER write "टीम वर्क" - MUST write "team work"
-- NEVER write "इमोशनल" - MUST write "emotional"
-- NEVER write "एमसीक्यू" - MUST write "MCQ"
-- NEVER write "बैकग्राउंड" - MUST write "background"
-- NEVER write "रिसोर्सेज" - MUST write "resources"
-- NEVER write "कंपैरिजन" - MUST write "comparison"
-- NEVER write "सिस्टम" - MUST write "system"
-- NEVER write "कैटेगराइज" - MUST write "categorize"
-- NEVER write "एजुकेशन" - MUST write "education"
-- NEVER write "फ्लेक्सिबल" - MUST write "flexible"
-- NEVER write "टैलेंट" - MUST write "talent"
-- NEVER write "नंबर्स" - MUST write "numbers"
-
-CORRECT EXAMPLES:
-✓ "मैं test दे रहा हूँ" (NOT "मैं टेस्ट दे रहा हूँ")
-✓ "student की capability" (NOT "स्टूडेंट की कैपेबिलिटी")
-✓ "standardized test में marks" (NOT "स्टैंडर्डाइज्ड टेस्ट में मार्क्स")
-✓ "creativity और practical skills" (NOT "क्रिएटिविटी और प्रैक्टिकल स्किल्स")
-✓ "education system को flexible बनाओ" (NOT "एजुकेशन सिस्टम को फ्लेक्सिबल बनाओ")
-
-HOW TO IDENTIFY WORD ORIGIN:
-- English words: test, student, paper, question, time, pressure, marks, intelligent, skills, creativity, team, work, emotional, background, resources, comparison, system, categorize, education, flexible, talent, numbers, theory, practical, learning, style, type, fair, capability, standardized, etc.
-- Hindi words: मैं, यार, कल, था, और, नहीं, लगता, कि, ये, किसी, की, हर, अलग, लेकिन, सिर्फ, ऊपर, मतलब, आ, गया, बस, सब, आपसे, पूछता, वहां, हां, बिल्कुल, चल, पीने, चलते, जरूर, etc.
-
-1. SCRIPT SEPARATION (MANDATORY - HIGHEST PRIORITY):
-   - Identify the ORIGINAL LANGUAGE of each word before writing it
-   - English origin words → Latin script ALWAYS
-   - Hindi origin words → Devanagari script ALWAYS
-   - This rule applies to ALL words including technical terms, borrowed words, and names
-   - When in doubt about a word's origin, if it sounds like an English word, write it in Latin script
-
-2. SPEAKER IDENTIFICATION:
-   - Identify and label each unique speaker as Speaker_1, Speaker_2, etc.
-   - Maintain consistent speaker labels throughout the transcription
-   - Detect speaker changes accurately based on voice characteristics
-
-3. EMOTION DETECTION (CRITICAL - DO NOT DEFAULT TO NEUTRAL):
-   - You MUST actively detect and classify emotions - DO NOT lazily mark everything as "neutral"
-   - Listen carefully to voice tone, pitch, speed, volume, and word choice
-   - Possible emotions (USE THESE ACTIVELY):
-     * frustrated - when annoyed, irritated, or facing obstacles
-     * angry - when expressing strong displeasure or rage
-     * sad - when expressing sorrow, disappointment, or melancholy
-     * worried - when expressing concern or anxiety about something
-     * anxious - when nervous, tense, or uneasy
-     * excited - when enthusiastic, energetic, or thrilled
-     * happy - when expressing joy, contentment, or satisfaction
-     * disappointed - when expectations are not met
-     * sarcastic - when using irony or mockery
-     * confused - when uncertain or puzzled
-     * surprised - when unexpected information is received
-     * skeptical - when doubting or questioning something
-     * curious - when interested in learning more
-     * bored - when uninterested or tired
-     * enthusiastic - when very eager or passionate
-     * affectionate - when expressing warmth or care
-     * fearful - when scared or afraid
-     * disgusted - when expressing revulsion or strong disapproval
-     * embarrassed - when feeling awkward or ashamed
-     * proud - when feeling accomplished or satisfied with achievement
-     * grateful - when expressing thanks or appreciation
-     * hopeful - when expressing optimism about future
-     * regretful - when expressing remorse or wishing things were different
-     * amused - when finding something funny or entertaining
-     * neutral - ONLY when speaker is completely emotionless and matter-of-fact
-   
-   EMOTION DETECTION GUIDELINES:
-   - If someone is complaining → frustrated, annoyed, or disappointed
-   - If someone is criticizing a system → frustrated, angry, or disgusted
-   - If someone is worried about future/outcomes → worried or anxious
-   - If someone is making a joke or being ironic → sarcastic or amused
-   - If someone agrees strongly → enthusiastic or satisfied
-   - If someone is uncertain → confused or skeptical
-   - If tone rises (louder/higher pitch) → likely angry, frustrated, or excited
-   - If tone drops (softer/lower pitch) → likely sad, disappointed, or worried
-   - If speech is fast and energetic → excited or enthusiastic
-   - If speech has pauses and sighs → sad, tired, or bored
-   - Default to "neutral" ONLY if absolutely no emotion is detectable (less than 10% of cases)
-
-4. LANGUAGE DETECTION:
-   - For each segment, identify the dominant language: "hindi", "english", or "hinglish"
-   - "hinglish" should be used when both languages are mixed in the segment
-
-5. TIMING AND SEGMENTATION:
-   - Provide accurate start_time and end_time in HH:MM:SS:MS format (e.g., "00:00:03:450" for 3.45 seconds)
-   - Format: Hours:Minutes:Seconds:Milliseconds (2 digits:2 digits:2 digits:3 digits)
-   - Mark end_of_speech as true when a speaker finishes their complete thought/sentence
-   - Mark end_of_speech as false for mid-sentence pauses or continuation
-
-6. TEXT ACCURACY:
-   - Transcribe exactly what is spoken, including filler words (um, uh, आ, उम्म, etc.)
-   - Preserve natural speech patterns and colloquialisms
-   - Handle overlapping speech by prioritizing the dominant speaker
-
-OUTPUT FORMAT:
-Return a JSON array where each object represents a speech segment with these exact fields:
-{
-  "start_time": "<HH:MM:SS:MS format>",
-  "end_time": "<HH:MM:SS:MS format>",
-  "speaker": "<Speaker_N>",
-  "text": "<transcribed text with proper script separation>",
-  "emotion": "<detected emotion - NOT neutral unless truly emotionless>",
-  "language": "<hindi|english|hinglish>",
-  "end_of_speech": <true|false>
-}
+        # Vertex AI init and model construction are cached across instances
+        self.model = _get_model(project_id, location)
+        self.short_clip_model = _get_model(project_id, location, SHORT_CLIP_MODEL_NAME)
+        
+        # Compact system prompt (sent with every request, so every character is billed input)
+        self.system_prompt = """Transcribe this Hinglish (Hindi-English mixed) audio with multiple speakers.
 
-EXAMPLE OUTPUT:
-[
-  {
-    "start_time": "00:00:00:350",
-    "end_time": "00:00:04:150",
-    "speaker": "Speaker_1",
-    "text": "यार test था और seriously मुझे नहीं लगता",
-    "emotion": "frustrated",
-    "language": "hinglish",
-    "end_of_speech": false
-  }
-]
-
-FINAL CRITICAL REMINDERS BEFORE YOU START:
-1. SCRIPT SEPARATION: English words like test, student, marks, system, pressure, etc. MUST be in Latin script. Only pure Hindi words like मैं, यार, था, नहीं, लगता, etc. should be in Devanagari
-2. EMOTION DETECTION: Actively listen to tone and context - DO NOT default to "neutral" unless truly emotionless. Most conversations have emotions!
-3. TIMESTAMPS: Use HH:MM:SS:MS format (e.g., "00:00:03:450" not 3.45)
-4. Review each word before writing - is it English origin? → Latin script. Hindi origin? → Devanagari
-
-Return ONLY the JSON array, no additional text or explanation."""
+RULES:
+1. SCRIPT: English-origin words in Latin script, Hindi-origin words in Devanagari. Never transliterate English into Devanagari (write "test", never "टेस्ट"). Examples:
+   ✓ "मैं test दे रहा हूँ"
+   ✓ "student की capability"
+   ✓ "standardized test में marks"
+   ✓ "education system को flexible बनाओ"
+2. SPEAKERS: Label as Speaker_1, Speaker_2, ... consistently.
+3. EMOTION: One of frustrated, angry, sad, worried, anxious, excited, happy, disappointed, sarcastic, confused, surprised, skeptical, curious, bored, enthusiastic, affectionate, fearful, disgusted, embarrassed, proud, grateful, hopeful, regretful, amused, neutral. Judge from tone, pitch, pace and words; use "neutral" only when truly emotionless.
+4. LANGUAGE: "hindi", "english" or "hinglish" (mixed).
+5. TIMING: start_time/end_time as HH:MM:SS:MS (e.g. "00:00:03:450"). end_of_speech is true when the speaker finishes a thought, false for mid-sentence pauses.
+6. TEXT: Verbatim, including fillers (um, आ, उम्म); for overlaps, keep the dominant speaker."""
 
     def transcribe_audio(self, audio_path: str) -> List[Dict]:
         """
@@ -189,57 +254,322 @@ Return ONLY the JSON array, no additional text or explanation."""
         Returns:
             List of dictionaries containing transcription segments
         """
-        # Read audio file
+        cache_key = self._cache_key(audio_path)
+        transcription = self._cache_get(cache_key)
+        if transcription is None:
+            transcription = self._transcribe_audio(audio_path)
+            self._cache_put(cache_key, transcription)
+        return transcription
+    
+    def _cache_key(self, audio_path: str) -> Optional[str]:
+        """Hash the audio content together with everything that shapes the model output"""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.blake2b(digest_size=32)
         with open(audio_path, 'rb') as audio_file:
-            audio_data = audio_file.read()
-        
-        # Determine MIME type based on file extension
-        extension = os.path.splitext(audio_path)[1].lower()
-        mime_type_map = {
-            '.mp3': 'audio/mp3',
-            '.wav': 'audio/wav',
-            '.m4a': 'audio/mp4',
-            '.ogg': 'audio/ogg',
-            '.flac': 'audio/flac',
-            '.aac': 'audio/aac'
-        }
-        mime_type = mime_type_map.get(extension, 'audio/mp3')
+            for block in iter(lambda: audio_file.read(1024 * 1024), b''):
+                digest.update(block)
+        digest.update(self.system_prompt.encode('utf-8'))
+        digest.update(f"{MODEL_NAME}|{SHORT_CLIP_MODEL_NAME}|{SHORT_CLIP_SECONDS}|{CHUNK_SECONDS}".encode('utf-8'))
+        digest.update(orjson.dumps(GENERATION_CONFIG, option=orjson.OPT_SORT_KEYS))
+        return digest.hexdigest()
+    
+    def _cache_get(self, cache_key: Optional[str]) -> Optional[List[Dict]]:
+        """Return a cached transcription, or None on a miss"""
+        if cache_key is None:
+            return None
+        try:
+            transcription = orjson.loads(Path(self.cache_dir, f"{cache_key}.json").read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        logger.info(f"Using cached transcription ({cache_key[:12]})")
+        return transcription
+    
+    def _cache_put(self, cache_key: Optional[str], transcription: List[Dict]):
+        """Store a transcription in the cache (write to a temp file, then rename atomically)"""
+        if cache_key is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = Path(self.cache_dir, f"{cache_key}.json")
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(transcription))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write transcription cache: {e}")
+    
+    def _transcribe_audio(self, audio_path: str) -> List[Dict]:
+        """Transcribe audio file with Gemini (single request or parallel chunks), bypassing the cache"""
+        try:
+            duration = _probe_duration(audio_path)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            duration = None  # ffprobe unavailable: send the file in one request
+        
+        if duration is None or duration <= CHUNK_SECONDS:
+            return list(self.iter_transcription(
+                audio_path, model=self._model_for_duration(duration), duration=duration
+            ))
+        
+        with tempfile.TemporaryDirectory() as chunk_dir:
+            chunk_paths = _split_audio(audio_path, CHUNK_SECONDS, chunk_dir)
+            logger.info(f"Audio is {duration:.0f}s long, transcribing {len(chunk_paths)} chunks in parallel")
+            
+            with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as executor:
+                chunk_results = list(executor.map(
+                    lambda chunk_path: list(self.iter_transcription(chunk_path)), chunk_paths
+                ))
+        
+        # Shift each chunk's timestamps by its position in the original file
+        transcription_data = []
+        for idx, segments in enumerate(chunk_results):
+            offset_ms = idx * CHUNK_SECONDS * 1000
+            for segment in segments:
+                if offset_ms:
+                    segment['start_time'] = _shift_timestamp(segment['start_time'], offset_ms)
+                    segment['end_time'] = _shift_timestamp(segment['end_time'], offset_ms)
+                transcription_data.append(segment)
+        
+        return transcription_data
+    
+    def _model_for_duration(self, duration: Optional[float]) -> GenerativeModel:
+        """Pick the smaller model for short clips and the default model otherwise"""
+        if duration is not None and duration < SHORT_CLIP_SECONDS:
+            return self.short_clip_model
+        return self.model
+    
+    @staticmethod
+    def _mime_type(audio_path: str) -> str:
+        """Determine MIME type based on file extension"""
+        return _MIME_BY_EXT.get(os.path.splitext(audio_path)[1].lower(), 'audio/mp3')
+    
+    def _audio_part(self, audio_path: str) -> Part:
+        """
+        Build the audio Part for a request
+        
+        The audio is first shrunk to 16 kHz mono Opus. With a GCS bucket configured the
+        file is uploaded once under its content hash and referenced by URI, which avoids
+        base64-inlining the audio into every request body. Without one the bytes are sent
+        inline.
+        
+        Args:
+            audio_path: Path to the audio file
+            
+        Returns:
+            Part referencing or containing the audio
+        """
+        with tempfile.TemporaryDirectory() as transcode_dir:
+            return self._build_audio_part(_transcode_for_upload(audio_path, transcode_dir))
+    
+    def _build_audio_part(self, audio_path: str) -> Part:
+        """Upload or inline the (already transcoded) audio file as a Part"""
+        mime_type = self._mime_type(audio_path)
+        if not self.gcs_bucket:
+            # Check the size before reading so oversized audio never gets loaded into memory
+            size = os.path.getsize(audio_path)
+            if size > INLINE_AUDIO_LIMIT_BYTES:
+                raise ValueError(
+                    f"Audio is {size / (1024 * 1024):.1f} MB, too large to send inline; "
+                    f"use --gcs-bucket (or HINGLISH_GCS_BUCKET) to upload it instead"
+                )
+            with open(audio_path, 'rb') as audio_file:
+                return Part.from_data(data=audio_file.read(), mime_type=mime_type)
+        
+        digest = hashlib.sha256()
+        with open(audio_path, 'rb') as audio_file:
+            for block in iter(lambda: audio_file.read(1024 * 1024), b''):
+                digest.update(block)
+        blob_name = f"audio/{digest.hexdigest()}{os.path.splitext(audio_path)[1].lower()}"
+        
+        if self._storage_client is None:
+            self._storage_client = storage.Client(project=self.project_id)
+        blob = self._storage_client.bucket(self.gcs_bucket).blob(blob_name)
+        try:
+            # if_generation_match=0 only creates the object, so identical audio is uploaded once
+            blob.upload_from_filename(audio_path, content_type=mime_type, if_generation_match=0)
+        except PreconditionFailed:
+            pass
+        
+        return Part.from_uri(f"gs://{self.gcs_bucket}/{blob_name}", mime_type=mime_type)
+    
+    def iter_transcription(self, audio_path: str, model: Optional[GenerativeModel] = None,
+                           duration: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Stream transcription segments as soon as the model has emitted each one
+        
+        Args:
+            audio_path: Path to the audio file
+            model: Model to use (default: the transcriber's default model)
+            duration: Audio duration in seconds, if already known (probed otherwise)
+            
+        Yields:
+            Transcription segment dictionaries, in order
+        
+        Raises:
+            ValueError: If the audio is longer than MAX_SINGLE_CALL_SECS
+        """
+        # Fail before uploading anything if a single request would be truncated anyway
+        if duration is None:
+            try:
+                duration = _probe_duration(audio_path)
+            except (OSError, subprocess.CalledProcessError, ValueError):
+                pass
+        if duration is not None and duration > MAX_SINGLE_CALL_SECS:
+            raise ValueError(
+                f"Audio is {duration:.0f}s long, more than {MAX_SINGLE_CALL_SECS}s fits in one request; "
+                f"use transcribe_audio, which splits it into chunks"
+            )
         
         # Create audio part
-        audio_part = Part.from_data(data=audio_data, mime_type=mime_type)
+        audio_part = self._audio_part(audio_path)
         
-        # Generate content with strict parameters
-        response = self.model.generate_content(
+        # Generate content with strict parameters, streaming the JSON array as it is produced
+        responses = (model or self.model).generate_content(
             [self.system_prompt, audio_part],
-            generation_config={
-                "temperature": 0.2,
-                "top_p": 0.8,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            }
+            generation_config=GENERATION_CONFIG,
+            stream=True
         )
         
-        # Parse the response
-        try:
-            # Extract JSON from response
-            response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            # Parse JSON
-            transcription_data = json.loads(response_text)
+        # Parse the response incrementally (structured output is a plain JSON array, no markdown fences):
+        # each complete top-level object is decoded and yielded, incomplete tails wait for more text
+        decoder = json.JSONDecoder()
+        buffer = ''
+        for chunk in responses:
+            buffer += chunk.text
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n[,':
+                    pos += 1
+                if pos >= len(buffer) or buffer[pos] == ']':
+                    break
+                try:
+                    segment, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break
+                yield segment
+            buffer = buffer[pos:]
+        
+        remainder = buffer.strip()
+        if remainder and remainder != ']':
+            logger.error("Error parsing JSON response: unexpected trailing data")
+            logger.error(f"Raw response tail: {remainder}")
+            raise json.JSONDecodeError("Unparsed trailing data in response", remainder, 0)
+    
+    async def transcribe_audio_async(self, audio_path: str) -> List[Dict]:
+        """
+        Transcribe audio file without blocking the event loop, so many files can overlap
+        
+        Args:
+            audio_path: Path to the audio file
             
-            return transcription_data
+        Returns:
+            List of dictionaries containing transcription segments
+        """
+        cache_key = await asyncio.to_thread(self._cache_key, audio_path)
+        transcription = self._cache_get(cache_key)
+        if transcription is not None:
+            return transcription
+        
+        try:
+            duration = await asyncio.to_thread(_probe_duration, audio_path)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            duration = None
+        
+        # Long files go through the chunked path, which already fans out over threads
+        if duration is not None and duration > CHUNK_SECONDS:
+            transcription = await asyncio.to_thread(self._transcribe_audio, audio_path)
+        else:
+            audio_part = await asyncio.to_thread(self._audio_part, audio_path)
+            response = await self._model_for_duration(duration).generate_content_async(
+                [self.system_prompt, audio_part],
+                generation_config=GENERATION_CONFIG
+            )
+            transcription = orjson.loads(response.text)
+        
+        self._cache_put(cache_key, transcription)
+        return transcription
+    
+    def transcribe_batch(self, audio_paths: List[str], gcs_uri_prefix: str,
+                         poll_interval: int = 60) -> Dict[str, List[Dict]]:
+        """
+        Transcribe many audio files with a Vertex AI batch prediction job
+        
+        Batch jobs are billed at the discounted batch rate and are not subject to the
+        online request quota, at the cost of minutes-to-hours turnaround. Use this for
+        offline workloads; use transcribe_audio when the result is needed right away.
+        
+        Args:
+            audio_paths: Paths to the local audio files
+            gcs_uri_prefix: gs://bucket/prefix under which audio, the request manifest
+                and the job output are stored
+            poll_interval: Seconds between job status checks
             
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON response: {e}")
-            print(f"Raw response: {response.text}")
-            raise
+        Returns:
+            Dictionary mapping each audio path to its transcription segments
+            (files whose request failed are left out)
+        """
+        bucket_name, _, prefix = gcs_uri_prefix[len('gs://'):].partition('/')
+        prefix = prefix.strip('/')
+        client = storage.Client(project=self.project_id)
+        bucket = client.bucket(bucket_name)
+        
+        # Stage the audio and build one request line per file (same settings as the online path)
+        generation_config = _rest_generation_config(GENERATION_CONFIG)
+        path_by_uri = {}
+        request_lines = []
+        for idx, audio_path in enumerate(audio_paths):
+            blob_name = f"{prefix}/audio/{idx:05d}_{os.path.basename(audio_path)}"
+            bucket.blob(blob_name).upload_from_filename(audio_path)
+            audio_uri = f"gs://{bucket_name}/{blob_name}"
+            path_by_uri[audio_uri] = audio_path
+            request_lines.append(orjson.dumps({
+                "request": {
+                    "contents": [{
+                        "role": "user",
+                        "parts": [
+                            {"text": self.system_prompt},
+                            {"fileData": {"fileUri": audio_uri, "mimeType": self._mime_type(audio_path)}},
+                        ],
+                    }],
+                    "generationConfig": generation_config,
+                }
+            }))
+        
+        manifest_name = f"{prefix}/requests.jsonl"
+        bucket.blob(manifest_name).upload_from_string(b'\n'.join(request_lines), content_type='application/jsonl')
+        
+        job = BatchPredictionJob.submit(
+            source_model=MODEL_NAME,
+            input_dataset=f"gs://{bucket_name}/{manifest_name}",
+            output_uri_prefix=f"gs://{bucket_name}/{prefix}/output"
+        )
+        logger.info(f"Submitted batch job {job.resource_name} for {len(audio_paths)} files")
+        
+        while not job.has_ended:
+            time.sleep(poll_interval)
+            job.refresh()
+        
+        if not job.has_succeeded:
+            raise RuntimeError(f"Batch job failed: {job.error}")
+        
+        # Collect results from the output shards
+        output_bucket, _, output_prefix = job.output_location[len('gs://'):].partition('/')
+        results = {}
+        for blob in client.list_blobs(output_bucket, prefix=output_prefix):
+            if not blob.name.endswith('.jsonl'):
+                continue
+            for line in blob.download_as_bytes().splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                audio_uri = record['request']['contents'][0]['parts'][1]['fileData']['fileUri']
+                audio_path = path_by_uri.get(audio_uri, audio_uri)
+                try:
+                    response_text = record['response']['candidates'][0]['content']['parts'][0]['text']
+                    results[audio_path] = orjson.loads(response_text)
+                except (KeyError, IndexError, orjson.JSONDecodeError) as e:
+                    logger.warning(f"Batch request for {audio_path} failed: {record.get('status') or e}")
+        
+        return results
     
     def transcribe_and_save(self, audio_path: str, output_path: str = None):
         """
@@ -249,46 +579,97 @@ Return ONLY the JSON array, no additional text or explanation."""
             audio_path: Path to the audio file
             output_path: Path to save the output JSON (optional)
         """
-        print(f"Transcribing audio file: {audio_path}")
+        logger.info(f"Transcribing audio file: {audio_path}")
         
         # Transcribe
         transcription = self.transcribe_audio(audio_path)
         
+        return self.save_transcription(audio_path, transcription, output_path)
+    
+    async def transcribe_and_save_async(self, audio_path: str, output_path: str = None):
+        """
+        Transcribe audio with the async client and save to JSON file
+        
+        Args:
+            audio_path: Path to the audio file
+            output_path: Path to save the output JSON (optional)
+        """
+        logger.info(f"Transcribing audio file: {audio_path}")
+        
+        transcription = await self.transcribe_audio_async(audio_path)
+        
+        return self.save_transcription(audio_path, transcription, output_path)
+    
+    def save_transcription(self, audio_path: str, transcription: List[Dict], output_path: str = None):
+        """
+        Save a transcription to JSON file and print its summary
+        
+        Args:
+            audio_path: Path to the transcribed audio file
+            transcription: Transcription segments
+            output_path: Path to save the output JSON (optional)
+        """
         # Determine output path
         if output_path is None:
             base_name = os.path.splitext(audio_path)[0]
             output_path = f"{base_name}_transcription.json"
         
-        # Save to JSON file with UTF-8 encoding for Devanagari support
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(transcription, f, ensure_ascii=False, indent=2)
-        
-        print(f"Transcription saved to: {output_path}")
-        print(f"Total segments: {len(transcription)}")
+        # Save to JSON file (orjson always writes UTF-8, so Devanagari is kept as-is)
+        Path(output_path).write_bytes(orjson.dumps(transcription, option=orjson.OPT_INDENT_2))
         
-        # Print summary
-        speakers = set(segment['speaker'] for segment in transcription)
-        print(f"Speakers detected: {len(speakers)} - {', '.join(sorted(speakers))}")
+        logger.info(f"Transcription saved to: {output_path}")
+        logger.info(f"Total segments: {len(transcription)}")
         
-        # Print emotion distribution
-        emotions = {}
+        # Count speakers and emotions in a single pass
+        speakers, emotions = Counter(), Counter()
         for segment in transcription:
-            emotion = segment.get('emotion', 'unknown')
-            emotions[emotion] = emotions.get(emotion, 0) + 1
+            speakers[segment['speaker']] += 1
+            emotions[segment.get('emotion', 'unknown')] += 1
+        
+        # Print summary (speakers in order of first appearance, as counted)
+        logger.info(f"Speakers detected: {len(speakers)} - {', '.join(speakers)}")
         
-        print(f"\nEmotion distribution:")
-        for emotion, count in sorted(emotions.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {emotion}: {count}")
+        # Print emotion distribution
+        logger.info("Emotion distribution:")
+        for emotion, count in emotions.most_common():
+            logger.info(f"  {emotion}: {count}")
         
         return transcription
 
 
+async def transcribe_files_async(transcriber: HinglishAudioTranscriber, audio_paths: List[str],
+                                 max_concurrency: int = MAX_CONCURRENT_FILES) -> int:
+    """
+    Transcribe several audio files concurrently on one event loop
+    
+    Args:
+        transcriber: Initialized transcriber
+        audio_paths: Paths to the audio files
+        max_concurrency: Maximum number of files in flight at once
+        
+    Returns:
+        Number of files that failed
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(audio_path):
+        async with semaphore:
+            try:
+                await transcriber.transcribe_and_save_async(audio_path)
+                return True
+            except Exception as e:
+                logger.error(f"Error during transcription of {audio_path}: {e}")
+                return False
+    
+    results = await asyncio.gather(*(run(audio_path) for audio_path in audio_paths))
+    return results.count(False)
+
+
 def main():
     """
     Main function to run the transcription
     """
     import argparse
-    import glob
     
     # Set up argument parser
     parser = argparse.ArgumentParser(
@@ -299,12 +680,14 @@ Examples:
   python hinglish_transcription_v2.py audio.mp3
   python hinglish_transcription_v2.py audio.mp3 --project-id my-project --output result.json
   python hinglish_transcription_v2.py audio.mp3 --location asia-south1
+  python hinglish_transcription_v2.py part1.mp3 part2.mp3 part3.mp3
         """
     )
     
     parser.add_argument(
-        'audio_file',
-        help='Path to the audio file to transcribe'
+        'audio_files',
+        nargs='+',
+        help='Path(s) to the audio file(s) to transcribe'
     )
     
     parser.add_argument(
@@ -324,6 +707,18 @@ Examples:
         help='Output JSON file path (default: <audio_file>_transcription.json)'
     )
     
+    parser.add_argument(
+        '--gcs-bucket',
+        default=os.environ.get('HINGLISH_GCS_BUCKET'),
+        help='GCS bucket to stage audio in instead of inlining it (can also set HINGLISH_GCS_BUCKET)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the API instead of reusing cached transcriptions'
+    )
+    
     parser.add_argument(
         '--credentials',
         help='Path to GCP credentials JSON file'
@@ -331,20 +726,31 @@ Examples:
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Auto-detect GCP credentials in current workspace if not already set
     if not os.environ.get('GOOGLE_APPLICATION_CREDENTIALS') and not args.credentials:
-        # Look for JSON files that might be credentials
-        json_files = glob.glob('*.json')
-        credential_files = [f for f in json_files if any(keyword in f.lower() 
-                           for keyword in ['credential', 'key', 'service', 'gcp', 'google'])]
+        # Look for JSON files that might be credentials (one directory scan, stop at the first match)
+        credentials_path = None
+        first_json = None
+        with os.scandir('.') as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or not name.endswith('.json') or not entry.is_file():
+                    continue
+                if first_json is None:
+                    first_json = name
+                lowered = name.lower()
+                if any(keyword in lowered for keyword in CREDENTIAL_KEYWORDS):
+                    credentials_path = name
+                    break
         
-        if credential_files:
-            credentials_path = credential_files[0]
+        if credentials_path:
             print(f"Auto-detected credentials file: {credentials_path}")
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-        elif json_files:
+        elif first_json:
             # If no obvious credential file, use the first JSON file
-            credentials_path = json_files[0]
+            credentials_path = first_json
             print(f"Using JSON file as credentials: {credentials_path}")
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
     
@@ -362,17 +768,22 @@ Examples:
         cred_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
         if cred_path and os.path.exists(cred_path):
             try:
-                with open(cred_path, 'r') as f:
-                    cred_data = json.load(f)
+                with open(cred_path, 'rb') as f:
+                    cred_data = orjson.loads(f.read())
                     args.project_id = cred_data.get('project_id')
                     if args.project_id:
                         print(f"Auto-detected project ID from credentials: {args.project_id}")
             except Exception as e:
                 print(f"Warning: Could not read project ID from credentials file: {e}")
     
-    # Validate audio file exists
-    if not os.path.exists(args.audio_file):
-        print(f"Error: Audio file not found: {args.audio_file}")
+    # Validate audio files exist
+    for audio_file in args.audio_files:
+        if not os.path.exists(audio_file):
+            print(f"Error: Audio file not found: {audio_file}")
+            return 1
+    
+    if args.output and len(args.audio_files) > 1:
+        print("Error: --output can only be used with a single audio file")
         return 1
     
     # Validate project ID
@@ -393,23 +804,33 @@ Examples:
     
     # print(f"Project ID: {args.project_id}")
     # print(f"Location: {args.location}")
-    print(f"Audio file: {args.audio_file}")
+    print(f"Audio file(s): {', '.join(args.audio_files)}")
     
     # Initialize transcriber
     try:
         transcriber = HinglishAudioTranscriber(
             project_id=args.project_id,
-            location=args.location
+            location=args.location,
+            gcs_bucket=args.gcs_bucket,
+            cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR
         )
     except Exception as e:
         print(f"Error initializing transcriber: {e}")
         print("Make sure your GCP credentials are set correctly.")
         return 1
     
+    # Several files: overlap their requests on one event loop
+    if len(args.audio_files) > 1:
+        failed = asyncio.run(transcribe_files_async(transcriber, args.audio_files))
+        if failed:
+            print(f"{failed} of {len(args.audio_files)} files failed")
+            return 1
+        return 0
+    
     # Transcribe audio file
     try:
         transcription = transcriber.transcribe_and_save(
-            audio_path=args.audio_file,
+            audio_path=args.audio_files[0],
             output_path=args.output
         )
         
@@ -430,4 +851,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
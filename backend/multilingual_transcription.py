@@ -17,32 +17,120 @@ Features:
 
 import os
 import sys
-import json
 import time
+import hashlib
+import logging
 from pathlib import Path
 import re
 import random
+import threading
+from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 from enum import Enum
 
+import orjson
+
 # Add parent directory to path to import from utils and pipeline
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from vertexai.generative_models import GenerativeModel, Part, GenerationConfig
 from vertexai.preview.generative_models import SafetySetting
-from pydub import AudioSegment
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from utils.file_utils import ensure_dir, save_json
+from utils.logging_utils import setup_queue_logging
 from utils.audio_splitter import split_audio
+from utils.audio_utils import get_audio_duration
 from pipeline.pipeline_config import GOOGLE_APPLICATION_CREDENTIALS
 
+logger = logging.getLogger(__name__)
+
 # Set Google credentials for authentication
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
 
 # Configuration
 AUDIO_CHUNKING_OFFSET = 300  # 5 minutes chunks
 MODEL_NAME = "gemini-2.5-flash"
+# Chunk requests are network-bound, so several can be in flight at once
+GEMINI_MAX_WORKERS = int(os.getenv('GEMINI_MAX_WORKERS', '4'))
+# Process-wide cap on concurrent Vertex AI calls (shared by all transcriptions running in this process)
+VERTEX_AI_MAX_CONCURRENT = int(os.getenv('VERTEX_AI_MAX_CONCURRENT', '8'))
+# Vertex AI requests-per-minute quota; calls are spaced to stay under it instead of retrying on 429s
+VERTEX_AI_RPM = float(os.getenv('VERTEX_AI_RPM', '60'))
+# Opt-in: chunked audio with at most this many chunks is sent in a single request (e.g. 2 for
+# audio just over the offset). Off by default since it relies on the model echoing per-audio markers.
+BATCH_MAX_CHUNKS = int(os.getenv('GEMINI_BATCH_MAX_CHUNKS', '0'))
+# Inline request payload limit for a batched request (Vertex AI rejects inline data much above 20MB)
+BATCH_MAX_BYTES = 15 * 1024 * 1024
+# Finished chunk transcriptions are kept here so a failed CLI run resumes without redoing them
+# (pass cache_dir=None to transcribe_audio, or --no-cache on the command line, to disable)
+CHUNK_CACHE_DIR = os.getenv('TRANSCRIBE_CACHE_DIR', os.path.join('.cache', 'transcribe'))
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often calls may start."""
+    
+    def __init__(self, requests_per_minute: float, capacity: float = 1.0):
+        """
+        Args:
+            requests_per_minute: Sustained rate at which tokens are refilled
+            capacity: Maximum burst size (default: 1, i.e. evenly spaced calls)
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Used to repair model responses that fail to parse as-is
+_TRAILING_COMMA_RE = re.compile(r',\s*([\]}])')
+_REQUIRED_FIELDS = frozenset(("start", "end", "text", "speaker", "language", "emotion", "end_of_speech"))
+
+
+@lru_cache(maxsize=1)
+def _get_model() -> GenerativeModel:
+    """Build the Gemini model on first use and share it across chunks and worker threads."""
+    # Not built at import time: the constructor resolves GCP credentials/project, and
+    # backend_api imports this module at startup
+    return GenerativeModel(MODEL_NAME)
+
+
+_SAFETY_SETTINGS = [
+    SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
+    SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
+    SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
+    SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
+]
+
+_GEN_CONFIG = GenerationConfig(
+    audio_timestamp=True,
+    max_output_tokens=8192,
+    temperature=0.05  # Very low temperature for strict instruction following
+)
+
+# Several chunks share one response in a batched request, so it gets a proportionally larger output budget
+_BATCH_MAX_OUTPUT_TOKENS = 8192
+
+# Separates the per-audio JSON blocks in a batched response, e.g. "### AUDIO 1 ###"
+_BATCH_MARKER_RE = re.compile(r'^#{3}\s*AUDIO\s+(\d+)\s*#{3}\s*$', re.MULTILINE)
+
+_VERTEX_AI_SLOTS = threading.BoundedSemaphore(VERTEX_AI_MAX_CONCURRENT)
+_RATE_LIMITER = RateLimiter(VERTEX_AI_RPM)
 
 
 class SupportedLanguage(Enum):
@@ -67,6 +155,15 @@ class SupportedLanguage(Enum):
         self.script = script
 
 
+# Lookup by code or upper-cased English name -> (code, english_name, native_name, script)
+_LANG_INDEX: Dict[str, Tuple[str, str, str, str]] = {}
+for _lang in SupportedLanguage:
+    _config = (_lang.code, _lang.english_name, _lang.native_name, _lang.script)
+    _LANG_INDEX[_lang.code] = _config
+    _LANG_INDEX.setdefault(_lang.english_name.upper(), _config)
+del _lang, _config
+
+
 def get_language_config(language_input: str) -> Tuple[str, str, str, str]:
     """
     Get language configuration by code or name (case-insensitive).
@@ -80,9 +177,9 @@ def get_language_config(language_input: str) -> Tuple[str, str, str, str]:
     language_input = language_input.strip().upper()
     
     # Try to match by code or English name
-    for lang in SupportedLanguage:
-        if lang.code == language_input or lang.english_name.upper() == language_input:
-            return lang.code, lang.english_name, lang.native_name, lang.script
+    config = _LANG_INDEX.get(language_input)
+    if config is not None:
+        return config
     
     # If not found in supported languages, return generic config
     print(f"⚠️  Warning: Language '{language_input}' not found in supported languages. Using as-is.")
@@ -100,7 +197,7 @@ def retry_with_backoff(func, max_retries=5, base_delay=15.0, max_delay=300.0, *a
             delay = min(max_delay, base_delay * (2 ** attempt))
             jitter = random.uniform(0, delay * 0.1)
             total_delay = delay + jitter
-            print(f"⚠️ Attempt {attempt + 1} failed: {str(e)}. Retrying in {total_delay:.1f}s...")
+            logger.warning("⚠️ Attempt %d failed: %s. Retrying in %.1fs...", attempt + 1, e, total_delay)
             time.sleep(total_delay)
 
 
@@ -131,33 +228,43 @@ def seconds_to_timestamp(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}:{milliseconds:03d}"
 
 
+def add_seconds_to_timestamp(timestamp: str, offset_seconds: int) -> str:
+    """
+    Shift a timestamp string like 'HH:MM:SS:mmm' by a whole number of seconds.
+    
+    The milliseconds field is carried over unchanged, so only integer arithmetic on
+    the H/M/S fields is needed; other formats fall back to a float round-trip.
+    """
+    parts = timestamp.split(":")
+    if len(parts) == 4 and len(parts[3]) == 3 and '.' not in parts[2]:
+        hours, minutes, seconds, milliseconds = parts
+        total = int(hours) * 3600 + int(minutes) * 60 + int(seconds) + offset_seconds
+        hours, rem = divmod(total, 3600)
+        minutes, seconds = divmod(rem, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{milliseconds}"
+    return seconds_to_timestamp(timestamp_to_seconds(timestamp) + offset_seconds)
+
+
 def deduplicate_entries(items: List[Dict]) -> List[Dict]:
-    """Remove duplicate entries with the same timestamps."""
+    """
+    Remove duplicate entries with the same timestamps.
+    
+    Only called on a single chunk's response (chunks cover disjoint time ranges, so
+    the merged result never needs a second pass).
+    """
     seen = set()
     deduplicated = []
-    
     for item in items:
         key = (item.get('start'), item.get('end'))
-        if key not in seen:
-            seen.add(key)
-            deduplicated.append(item)
-    
+        if key in seen:
+            continue
+        seen.add(key)
+        deduplicated.append(item)
     return deduplicated
 
 
-def safe_extract_json(content: str) -> List[Dict]:
-    """Extract and parse JSON from model response."""
-    # Try to find JSON block
-    json_match = re.search(r'```json\s*(.*?)```', content, re.DOTALL)
-    
-    if not json_match:
-        # Try without closing backticks (truncated response)
-        json_match = re.search(r'```json\s*(.*)', content, re.DOTALL)
-        if not json_match:
-            raise ValueError("No JSON block found in content.")
-    
-    json_str = json_match.group(1).strip()
-    
+def _repair_json(json_str: str) -> List[Dict]:
+    """Recover the complete entries from a truncated or slightly malformed JSON array."""
     # Handle incomplete JSON
     if not json_str.endswith(']'):
         last_complete = json_str.rfind('}')
@@ -171,20 +278,38 @@ def safe_extract_json(content: str) -> List[Dict]:
         json_str = f"[{json_str}]"
     
     # Remove trailing commas
-    json_str = re.sub(r',\s*([\]}])', r'\1', json_str)
+    json_str = _TRAILING_COMMA_RE.sub(r'\1', json_str)
     
     try:
-        json_data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON parsing error: {e}")
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
+        logger.error("❌ JSON parsing error: %s", e)
         raise ValueError(f"Failed to parse JSON: {e}")
+
+
+def safe_extract_json(content: str) -> List[Dict]:
+    """Extract and parse JSON from model response."""
+    # Find the JSON block (the closing backticks are missing if the response was truncated)
+    fence = content.find('```json')
+    if fence == -1:
+        raise ValueError("No JSON block found in content.")
+    block_start = fence + len('```json')
+    block_end = content.find('```', block_start)
+    json_str = content[block_start:block_end if block_end != -1 else len(content)].strip()
+    
+    # Well-formed responses parse in one pass; only fall back to repairs when that fails
+    try:
+        json_data = orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        json_data = _repair_json(json_str)
+    if isinstance(json_data, dict):
+        json_data = [json_data]
     
     # Validate and clean data
     valid_items = []
     for item in json_data:
-        required_fields = ["start", "end", "text", "speaker", "language", "emotion", "end_of_speech"]
-        if not all(k in item for k in required_fields):
-            print(f"⚠️ Warning: Skipping invalid item (missing fields): {item}")
+        if not (isinstance(item, dict) and _REQUIRED_FIELDS <= item.keys()):
+            logger.warning("⚠️ Skipping invalid item (missing fields): %s", item)
             continue
         valid_items.append(item)
     
@@ -198,6 +323,8 @@ def merge_json_with_offset(data: Dict[int, List[Dict]], time_offset: int) -> Lis
     """
     Merge multiple JSON arrays and apply time offset for each chunk.
     
+    Entries are updated in place, so the arrays in ``data`` are consumed by the merge.
+    
     Args:
         data: Dictionary where keys are chunk indices and values are JSON arrays
         time_offset: Time in seconds to offset for each chunk
@@ -210,25 +337,25 @@ def merge_json_with_offset(data: Dict[int, List[Dict]], time_offset: int) -> Lis
     
     for i, json_array in sorted_data:
         offset_seconds = i * time_offset
+        # Chunk results aren't used after merging, so entries are shifted in place
         for entry in json_array:
-            new_entry = entry.copy()
-            new_entry['start'] = seconds_to_timestamp(
-                timestamp_to_seconds(entry['start']) + offset_seconds
-            )
-            new_entry['end'] = seconds_to_timestamp(
-                timestamp_to_seconds(entry['end']) + offset_seconds
-            )
-            merged_array.append(new_entry)
+            entry['start'] = add_seconds_to_timestamp(entry['start'], offset_seconds)
+            entry['end'] = add_seconds_to_timestamp(entry['end'], offset_seconds)
+        merged_array.extend(json_array)
     
     return merged_array
 
 
+@lru_cache(maxsize=32)
 def build_transcription_prompt(language_code: str, language_name: str, 
                                native_name: str, script_name: str,
                                reference_text: Optional[str] = None) -> str:
     """
     Build a comprehensive transcription prompt for the specified language.
     
+    Cached, since every chunk of a file (and every file in the same language) asks for
+    the same prompt; all arguments are plain strings, so they form the cache key.
+    
     Args:
         language_code: Language code (e.g., 'HIN', 'BEN')
         language_name: English name of the language
@@ -456,9 +583,71 @@ def build_transcription_prompt(language_code: str, language_name: str,
     return prompt
 
 
+def _chunk_cache_key(chunk_bytes: bytes, language_code: str, prompt: str) -> str:
+    """Cache key for a chunk: its audio, language and prompt (which embeds any reference text)"""
+    digest = hashlib.sha256(chunk_bytes)
+    for part in (language_code, prompt, MODEL_NAME):
+        digest.update(b'\0' + part.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _chunk_cache_get(cache_dir: Optional[str], cache_key: str) -> Optional[List[Dict]]:
+    """Return a cached chunk transcription, or None on a miss (or when caching is disabled)"""
+    if cache_dir is None:
+        return None
+    try:
+        return orjson.loads(Path(cache_dir, f"{cache_key}.json").read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _chunk_cache_put(cache_dir: Optional[str], cache_key: str, json_data: List[Dict]):
+    """Store a chunk transcription (write to a temp file, then rename atomically)"""
+    if cache_dir is None:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_path = Path(cache_dir, f"{cache_key}.json")
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(json_data))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("⚠️ Could not write chunk cache: %s", e)
+
+
+def _generate_streamed(contents: list, generation_config: GenerationConfig = _GEN_CONFIG) -> tuple:
+    """
+    Run one Vertex AI request and collect its streamed response.
+    
+    Streaming means text is received while the model is still generating; a failure
+    mid-stream raises here and the whole call is retried by the caller.
+    
+    Returns:
+        Tuple of (response_text, finish_reason)
+    """
+    _RATE_LIMITER.acquire()
+    with _VERTEX_AI_SLOTS:
+        text_parts = []
+        finish_reason = None
+        for chunk in _get_model().generate_content(
+            contents,
+            generation_config=generation_config,
+            safety_settings=_SAFETY_SETTINGS,
+            stream=True
+        ):
+            if not chunk.candidates:
+                continue
+            candidate = chunk.candidates[0]
+            if candidate.content.parts:
+                text_parts.append(candidate.content.text)
+            finish_reason = candidate.finish_reason
+        return ''.join(text_parts), finish_reason
+
+
 def transcribe_chunk(idx: int, chunk_path: str, language_code: str, 
                      language_name: str, native_name: str, script_name: str,
-                     reference_text: Optional[str] = None) -> tuple:
+                     reference_text: Optional[str] = None,
+                     cache_dir: Optional[str] = CHUNK_CACHE_DIR) -> tuple:
     """
     Transcribe a single audio chunk for any language with speaker identification.
     
@@ -470,56 +659,151 @@ def transcribe_chunk(idx: int, chunk_path: str, language_code: str,
         native_name: Native name of language
         script_name: Name of script
         reference_text: Optional reference text
+        cache_dir: Directory for cached chunk results (None disables the cache)
     
     Returns:
         Tuple of (index, transcription_data)
     """
-    model = GenerativeModel(MODEL_NAME)
-    
     prompt = build_transcription_prompt(
         language_code, language_name, native_name, script_name, reference_text
     )
     
-    with open(chunk_path, "rb") as af:
-        audio_file = Part.from_data(af.read(), mime_type="audio/mpeg")
-    
-    safety_settings = [
-        SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
-        SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
-        SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
-        SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
-    ]
+    chunk_bytes = Path(chunk_path).read_bytes()
+    cache_key = _chunk_cache_key(chunk_bytes, language_code, prompt)
+    cached = _chunk_cache_get(cache_dir, cache_key)
+    if cached is not None:
+        logger.info("♻️ Chunk %s loaded from cache: %d segments", idx, len(cached))
+        return idx, cached
     
-    def call_model():
-        config = GenerationConfig(
-            audio_timestamp=True,
-            max_output_tokens=8192,
-            temperature=0.05  # Very low temperature for strict instruction following
-        )
-        return model.generate_content(
-            [audio_file, prompt],
-            generation_config=config,
-            safety_settings=safety_settings
-        )
+    audio_file = Part.from_data(chunk_bytes, mime_type="audio/mpeg")
+    del chunk_bytes
     
-    print(f"🎤 Processing chunk {idx}...")
-    response = retry_with_backoff(call_model)
+    logger.info("🎤 Processing chunk %s...", idx)
+    content, finish_reason = retry_with_backoff(_generate_streamed, contents=[audio_file, prompt])
     
-    # Check finish reason
-    finish_reason = response.candidates[0].finish_reason
+    # Check finish reason (reported on the last streamed chunk)
     if finish_reason != 1:
-        print(f"⚠️ Warning: Response may be incomplete. Finish reason: {finish_reason}")
+        logger.warning("⚠️ Response for chunk %s may be incomplete. Finish reason: %s", idx, finish_reason)
     
-    content = response.candidates[0].content.text
     json_data = safe_extract_json(content)
+    if finish_reason == 1:  # don't pin a truncated response in the cache
+        _chunk_cache_put(cache_dir, cache_key, json_data)
     
-    print(f"✅ Chunk {idx} completed: {len(json_data)} segments transcribed")
+    logger.info("✅ Chunk %s completed: %d segments transcribed", idx, len(json_data))
     return idx, json_data
 
 
+def split_batch_response(content: str, expected: int) -> List[List[Dict]]:
+    """
+    Split a batched response into one transcription per audio.
+    
+    Args:
+        content: Model response with a "### AUDIO k ###" marker before each JSON block
+        expected: Number of audios sent in the request
+    
+    Returns:
+        Transcriptions in audio order
+    """
+    sections = _BATCH_MARKER_RE.split(content)
+    # re.split with one group yields [preamble, number, section, number, section, ...]
+    by_number = {int(number): section for number, section in zip(sections[1::2], sections[2::2])}
+    if sorted(by_number) != list(range(1, expected + 1)):
+        raise ValueError(f"Expected {expected} audio sections, found markers {sorted(by_number)}")
+    return [safe_extract_json(by_number[n]) for n in range(1, expected + 1)]
+
+
+def transcribe_chunk_batch(chunks: List[Tuple[int, str]], language_code: str,
+                           language_name: str, native_name: str, script_name: str,
+                           reference_text: Optional[str] = None,
+                           cache_dir: Optional[str] = CHUNK_CACHE_DIR) -> Dict[int, List[Dict]]:
+    """
+    Transcribe several short chunks in a single Vertex AI request.
+    
+    Each chunk is sent as its own audio part and the model returns one JSON array per
+    audio, so the fixed per-request latency is paid once. Falls back to one request per
+    chunk if the audio is too large for a single request or the response can't be split.
+    
+    Args:
+        chunks: List of (chunk_index, chunk_path) tuples
+        language_code: Language code
+        language_name: English name of language
+        native_name: Native name of language
+        script_name: Name of script
+        reference_text: Optional reference text
+        cache_dir: Directory for cached chunk results, read-only here (None disables the cache)
+    
+    Returns:
+        Dictionary mapping chunk index to its transcription data
+    """
+    def transcribe_each():
+        with ThreadPoolExecutor(max_workers=GEMINI_MAX_WORKERS) as executor:
+            return dict(executor.map(
+                lambda chunk: transcribe_chunk(chunk[0], chunk[1], language_code, language_name,
+                                               native_name, script_name, reference_text, cache_dir),
+                chunks
+            ))
+    
+    if len(chunks) < 2 or sum(os.path.getsize(path) for _, path in chunks) > BATCH_MAX_BYTES:
+        return transcribe_each()
+    
+    prompt = build_transcription_prompt(
+        language_code, language_name, native_name, script_name, reference_text
+    )
+    
+    results = {}
+    contents = []
+    pending = []
+    for idx, chunk_path in chunks:
+        chunk_bytes = Path(chunk_path).read_bytes()
+        cache_key = _chunk_cache_key(chunk_bytes, language_code, prompt)
+        cached = _chunk_cache_get(cache_dir, cache_key)
+        if cached is not None:
+            logger.info("♻️ Chunk %s loaded from cache: %d segments", idx, len(cached))
+            results[idx] = cached
+            continue
+        pending.append(idx)
+        contents.append(f"=== AUDIO {len(pending)} ===")
+        contents.append(Part.from_data(chunk_bytes, mime_type="audio/mpeg"))
+    
+    if not pending:
+        return results
+    
+    contents.append(
+        f"{prompt}\n"
+        f"You were given {len(pending)} separate audio files, each preceded by an \"=== AUDIO k ===\" label. "
+        f"Transcribe each one independently, with timestamps measured from the start of that audio. "
+        f"For each audio, in order, output a line \"### AUDIO k ###\" followed by its JSON array in a ```json block."
+    )
+    generation_config = GenerationConfig(
+        audio_timestamp=True,
+        max_output_tokens=_BATCH_MAX_OUTPUT_TOKENS * len(pending),
+        temperature=0.05
+    )
+    
+    logger.info("🎤 Processing chunks %s in one request...", pending)
+    try:
+        content, finish_reason = retry_with_backoff(
+            _generate_streamed, contents=contents, generation_config=generation_config
+        )
+        if finish_reason != 1:
+            raise ValueError(f"Response may be incomplete. Finish reason: {finish_reason}")
+        transcriptions = split_batch_response(content, len(pending))
+    except ValueError as e:
+        logger.warning("⚠️ Batched request unusable (%s). Transcribing chunks separately...", e)
+        return transcribe_each()
+    
+    # Not cached: batched timestamps are less reliable than single-chunk ones, and a cache
+    # entry would pin them for every later run
+    for idx, json_data in zip(pending, transcriptions):
+        results[idx] = json_data
+        logger.info("✅ Chunk %s completed: %d segments transcribed", idx, len(json_data))
+    return results
+
+
 def transcribe_chunks(audio_path: str, duration: float, language_code: str,
                      language_name: str, native_name: str, script_name: str,
-                     reference_text: Optional[str] = None) -> List[Dict]:
+                     reference_text: Optional[str] = None,
+                     cache_dir: Optional[str] = CHUNK_CACHE_DIR) -> List[Dict]:
     """
     Transcribe audio by splitting into chunks and processing in parallel.
     
@@ -531,19 +815,29 @@ def transcribe_chunks(audio_path: str, duration: float, language_code: str,
         native_name: Native name of language
         script_name: Name of script
         reference_text: Optional reference text
+        cache_dir: Directory for cached chunk results (None disables the cache)
     
     Returns:
         Combined transcription data
     """
     chunks_dict = split_audio(audio_path)
+    
+    # A handful of short chunks is cheaper as one request than as several in parallel
+    if len(chunks_dict) <= BATCH_MAX_CHUNKS:
+        results = transcribe_chunk_batch(
+            sorted(chunks_dict.items()), language_code, language_name,
+            native_name, script_name, reference_text, cache_dir
+        )
+        return merge_json_with_offset(results, AUDIO_CHUNKING_OFFSET)
+    
     results = {}
     
-    # Process chunks (can increase max_workers for faster processing)
-    with ThreadPoolExecutor(max_workers=1) as executor:
+    # Process chunks concurrently
+    with ThreadPoolExecutor(max_workers=GEMINI_MAX_WORKERS) as executor:
         future_to_idx = {
             executor.submit(
                 transcribe_chunk, idx, chunk_path, language_code,
-                language_name, native_name, script_name, reference_text
+                language_name, native_name, script_name, reference_text, cache_dir
             ): idx
             for idx, chunk_path in chunks_dict.items()
         }
@@ -554,7 +848,7 @@ def transcribe_chunks(audio_path: str, duration: float, language_code: str,
                 idx, json_data = future.result()
                 results[idx] = json_data
             except Exception as e:
-                print(f"❌ Error processing chunk {idx}: {str(e)}")
+                logger.error("❌ Error processing chunk %s: %s", idx, e)
                 raise
     
     # Merge chunks with time offset
@@ -564,7 +858,8 @@ def transcribe_chunks(audio_path: str, duration: float, language_code: str,
 
 def transcribe_audio(audio_path: str, output_json: str, 
                     source_language: str = "HIN",
-                    reference_text: Optional[str] = None) -> List[Dict]:
+                    reference_text: Optional[str] = None,
+                    cache_dir: Optional[str] = CHUNK_CACHE_DIR) -> List[Dict]:
     """
     Main function to transcribe audio in any supported language with multiple speakers.
     
@@ -573,6 +868,8 @@ def transcribe_audio(audio_path: str, output_json: str,
         output_json: Path to save the output JSON file
         source_language: Source language code (e.g., 'HIN', 'BEN', 'HINGLISH')
         reference_text: Optional reference text for the audio content
+        cache_dir: Directory for cached chunk results (default: TRANSCRIBE_CACHE_DIR or
+            .cache/transcribe; None disables the cache)
     
     Returns:
         List containing transcription results
@@ -598,8 +895,7 @@ def transcribe_audio(audio_path: str, output_json: str,
     
     # Get audio duration
     print("📊 Analyzing audio file...")
-    audio = AudioSegment.from_file(audio_path)
-    audio_duration = len(audio) / 1000.0  # Convert to seconds
+    audio_duration = get_audio_duration(audio_path)
     print(f"⏱️  Audio Duration: {audio_duration:.2f} seconds ({audio_duration/60:.2f} minutes)")
     
     # Transcribe
@@ -609,13 +905,13 @@ def transcribe_audio(audio_path: str, output_json: str,
         print(f"🎤 Processing single audio file...")
         idx, transcription_data = transcribe_chunk(
             0, audio_path, lang_code, lang_name, native_name, 
-            script_name, reference_text
+            script_name, reference_text, cache_dir
         )
     else:
         print(f"🎤 Audio is long. Splitting into {int(audio_duration / AUDIO_CHUNKING_OFFSET) + 1} chunks...")
         transcription_data = transcribe_chunks(
             audio_path, audio_duration, lang_code, lang_name, 
-            native_name, script_name, reference_text
+            native_name, script_name, reference_text, cache_dir
         )
     
     # Organize output
@@ -661,28 +957,18 @@ def analyze_transcription(json_path: str):
     Args:
         json_path: Path to the transcription JSON file
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        transcription = json.load(f)
+    with open(json_path, 'rb') as f:
+        transcription = orjson.loads(f.read())
     
-    # Emotion statistics
-    emotion_stats = {}
+    # Emotion and speaker statistics in a single pass
+    emotion_stats = Counter()
+    speaker_stats = defaultdict(lambda: {'count': 0, 'emotions': Counter()})
     for segment in transcription:
         emotion = segment.get('emotion', 'neutral')
-        emotion_stats[emotion] = emotion_stats.get(emotion, 0) + 1
-    
-    # Speaker statistics
-    speaker_stats = {}
-    for segment in transcription:
-        speaker = segment.get('speaker', 'Unknown')
-        if speaker not in speaker_stats:
-            speaker_stats[speaker] = {
-                'count': 0,
-                'emotions': {}
-            }
-        speaker_stats[speaker]['count'] += 1
-        
-        emotion = segment.get('emotion', 'neutral')
-        speaker_stats[speaker]['emotions'][emotion] = speaker_stats[speaker]['emotions'].get(emotion, 0) + 1
+        stats = speaker_stats[segment.get('speaker', 'Unknown')]
+        emotion_stats[emotion] += 1
+        stats['count'] += 1
+        stats['emotions'][emotion] += 1
     
     print(f"\n{'='*100}")
     print(f"📊 TRANSCRIPTION ANALYSIS")
@@ -690,14 +976,14 @@ def analyze_transcription(json_path: str):
     print(f"📝 Total Segments: {len(transcription)}")
     
     print(f"\n😊 Emotion Distribution:")
-    for emotion, count in sorted(emotion_stats.items(), key=lambda x: x[1], reverse=True):
+    for emotion, count in emotion_stats.most_common():
         print(f"   {emotion.capitalize()}: {count} segments ({count/len(transcription)*100:.1f}%)")
     
     print(f"\n👥 Speaker Statistics:")
     for speaker, stats in sorted(speaker_stats.items()):
         print(f"\n   {speaker}:")
         print(f"      Total segments: {stats['count']}")
-        print(f"      Top Emotions: {', '.join([f'{e}: {c}' for e, c in sorted(stats['emotions'].items(), key=lambda x: x[1], reverse=True)[:3]])}")
+        print(f"      Top Emotions: {', '.join([f'{e}: {c}' for e, c in stats['emotions'].most_common(3)])}")
     
     print(f"{'='*100}\n")
 
@@ -717,6 +1003,8 @@ def list_supported_languages():
 if __name__ == "__main__":
     import sys
     
+    setup_queue_logging(fmt='%(message)s')
+    
     if len(sys.argv) < 2:
         print("Usage: python multilingual_transcription.py <audio_file> <language> [options]")
         print("\nRequired Arguments:")
@@ -725,6 +1013,7 @@ if __name__ == "__main__":
         print("\nOptional Arguments:")
         print("  --output, -o       Output JSON file path")
         print("  --reference, -r    Reference text file path (optional)")
+        print("  --no-cache         Don't read or write cached chunk results")
         print("  --list-languages   Show all supported languages")
         print("\nExamples:")
         print("  python multilingual_transcription.py audio.mp3 Hindi")
@@ -757,6 +1046,7 @@ if __name__ == "__main__":
     # Parse optional arguments
     output_file = None
     reference_text_path = None
+    cache_dir = CHUNK_CACHE_DIR
     
     i = start_index
     while i < len(sys.argv):
@@ -767,6 +1057,9 @@ if __name__ == "__main__":
         elif arg in ["--reference", "-r"] and i + 1 < len(sys.argv):
             reference_text_path = sys.argv[i + 1]
             i += 2
+        elif arg == "--no-cache":
+            cache_dir = None
+            i += 1
         else:
             i += 1
     
@@ -795,7 +1088,8 @@ if __name__ == "__main__":
             audio_path=audio_file,
             output_json=output_file,
             source_language=source_language,
-            reference_text=reference_text
+            reference_text=reference_text,
+            cache_dir=cache_dir
         )
         
         # Analyze
@@ -0,0 +1,38 @@
+"""
+Launcher for the Audio Transcription Backend API.
+
+Usage (from the project root):
+    python backend/serve.py
+
+With FLASK_ENV=production the process is handed to gunicorn before the API module
+(MongoDB client, storage manager, models) is imported; otherwise the API runs on the
+Flask development server.
+"""
+import os
+import runpy
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# Workers must share these; backend_api falls back to a per-process temp dir when unset
+SHARED_FOLDER_VARS = ('UPLOAD_FOLDER', 'OUTPUT_FOLDER')
+
+
+def main():
+    if os.getenv('FLASK_ENV') != 'production':
+        sys.path.insert(0, str(PROJECT_ROOT))
+        runpy.run_module('backend.backend_api', run_name='__main__')
+        return 0
+
+    missing = [name for name in SHARED_FOLDER_VARS if not os.getenv(name)]
+    if missing:
+        print(f"❌ {', '.join(missing)} must be set when FLASK_ENV=production "
+              f"(every gunicorn worker needs the same folders)")
+        return 1
+
+    gunicorn_conf = str(Path(__file__).parent / 'gunicorn.conf.py')
+    os.execvp('gunicorn', ['gunicorn', '--chdir', str(PROJECT_ROOT), '-c', gunicorn_conf, 'backend.backend_api:app'])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,14 @@
 """
 Audio splitting utility for processing large audio files in chunks.
 """
+import logging
 import os
+import subprocess
 from pydub import AudioSegment
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 def split_audio(audio_path, chunk_duration_seconds=300, output_dir=None):
     """
@@ -18,11 +22,6 @@ def split_audio(audio_path, chunk_duration_seconds=300, output_dir=None):
     Returns:
         Dictionary mapping chunk index to chunk file path
     """
-    # Load the audio file
-    audio = AudioSegment.from_file(audio_path)
-    audio_duration_ms = len(audio)
-    chunk_duration_ms = chunk_duration_seconds * 1000
-    
     # Create output directory
     if output_dir is None:
         audio_dir = os.path.dirname(audio_path)
@@ -31,6 +30,18 @@ def split_audio(audio_path, chunk_duration_seconds=300, output_dir=None):
     
     os.makedirs(output_dir, exist_ok=True)
     
+    # MP3 input can be cut on packet boundaries without decoding or re-encoding
+    if Path(audio_path).suffix.lower() == ".mp3":
+        try:
+            return _segment_mp3(audio_path, chunk_duration_seconds, output_dir)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("⚠️ ffmpeg segmenting failed (%s), falling back to pydub", e)
+    
+    # Load the audio file
+    audio = AudioSegment.from_file(audio_path)
+    audio_duration_ms = len(audio)
+    chunk_duration_ms = chunk_duration_seconds * 1000
+    
     chunks_dict = {}
     chunk_index = 0
     
@@ -56,6 +67,43 @@ def split_audio(audio_path, chunk_duration_seconds=300, output_dir=None):
     return chunks_dict
 
 
+def _segment_mp3(audio_path, chunk_duration_seconds, output_dir):
+    """
+    Split an MP3 file into chunks with ffmpeg stream copy (no decode, lossless).
+    
+    Args:
+        audio_path: Path to the MP3 file to split
+        chunk_duration_seconds: Duration of each chunk in seconds
+        output_dir: Directory to save chunks
+        
+    Returns:
+        Dictionary mapping chunk index to chunk file path
+    """
+    list_path = os.path.join(output_dir, "chunks.txt")
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-y", "-i", audio_path,
+         # Audio only: embedded cover art would otherwise be copied into every chunk
+         "-map", "0:a",
+         "-f", "segment", "-segment_time", str(chunk_duration_seconds),
+         "-segment_list", list_path, "-segment_list_type", "flat",
+         "-c", "copy", "-reset_timestamps", "1",
+         os.path.join(output_dir, "chunk_%03d.mp3")],
+        capture_output=True, check=True
+    )
+    
+    # The segment list names exactly the files written by this run, in order
+    try:
+        with open(list_path) as f:
+            chunk_names = [line.strip() for line in f if line.strip()]
+    finally:
+        os.remove(list_path)
+    
+    return {
+        chunk_index: os.path.join(output_dir, chunk_name)
+        for chunk_index, chunk_name in enumerate(chunk_names)
+    }
+
+
 def merge_audio_chunks(chunk_paths, output_path):
     """
     Merge audio chunks back into a single file.
@@ -2,6 +2,7 @@
 Audio processing utility functions.
 """
 import os
+import subprocess
 from pydub import AudioSegment
 
 
@@ -47,14 +48,25 @@ def get_audio_duration(audio_path):
     """
     Get the duration of an audio file in seconds.
     
+    Reads the container header with ffprobe instead of decoding the whole file;
+    falls back to a full pydub decode if ffprobe is unavailable or fails.
+    
     Args:
         audio_path: Path to audio file
         
     Returns:
         Duration in seconds
     """
-    audio = AudioSegment.from_file(audio_path)
-    return len(audio) / 1000.0
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
+            capture_output=True, text=True, check=True
+        )
+        return float(result.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        audio = AudioSegment.from_file(audio_path)
+        return len(audio) / 1000.0
 
 
 def convert_audio_format(input_path, output_path, output_format="wav"):
@@ -2,9 +2,10 @@
 File utility functions for the transcription pipeline.
 """
 import os
-import json
 import shutil
 
+import orjson
+
 
 def ensure_dir(directory):
     """
@@ -19,14 +20,14 @@ def ensure_dir(directory):
 
 def save_json(data, output_path):
     """
-    Save data to JSON file with proper formatting.
+    Save data to JSON file with proper formatting (UTF-8, 2-space indent).
     
     Args:
         data: Dictionary or list to save
         output_path: Path to output JSON file
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
 
 
 def load_json(input_path):
@@ -39,8 +40,8 @@ def load_json(input_path):
     Returns:
         Loaded data
     """
-    with open(input_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(input_path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def clear_gpu_memory():
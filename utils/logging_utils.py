@@ -0,0 +1,42 @@
+"""
+Logging utility functions.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+_listener = None
+
+
+def setup_queue_logging(level=logging.INFO, fmt='%(asctime)s %(levelname)s [%(name)s] %(message)s'):
+    """
+    Route all log records through an in-memory queue drained by a background thread.
+
+    Request threads only enqueue records; the listener thread does the (blocking)
+    stream writes. Safe to call more than once - later calls reuse the first listener.
+
+    Args:
+        level: Root logger level
+        fmt: Log line format
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
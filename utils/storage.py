@@ -2,19 +2,110 @@
 Storage utilities for S3 and MongoDB operations.
 """
 import os
+import threading
 import boto3
-from pymongo import MongoClient
+from boto3.s3.transfer import TransferConfig
+from pymongo import MongoClient, InsertOne
+from pymongo.errors import BulkWriteError
+from bson import ObjectId
+from bson.errors import InvalidId
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import json
 
 
+# Multipart settings for audio uploads (16 MB parts, 8 in flight; uploads are capped at 100 MB)
+AUDIO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+
+class InsertBatcher:
+    """
+    Coalesces concurrent inserts into unordered bulk_write batches.
+    
+    Callers block until the batch containing their document is written. A document is
+    written as soon as the writer thread is free; inserts that arrive while a batch is
+    being written are grouped into the next one (up to max_batch documents).
+    """
+    
+    def __init__(self, collection, max_batch: int = 500):
+        self.collection = collection
+        self.max_batch = max_batch
+        self._pending = []
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='mongo-insert-batcher', daemon=True)
+        self._thread.start()
+    
+    def insert(self, document: Dict[str, Any], timeout: float = 30.0) -> ObjectId:
+        """
+        Queue a document for insertion and wait for it to be written.
+        
+        Args:
+            document: Document to insert (copied; an _id is assigned if missing)
+            timeout: Seconds to wait for the document to reach the writer thread
+            
+        Returns:
+            The inserted document's _id
+        """
+        document = dict(document)
+        document.setdefault('_id', ObjectId())
+        entry = {'document': document, 'done': threading.Event(), 'error': None}
+        
+        with self._cond:
+            self._pending.append(entry)
+            if len(self._pending) == 1:
+                self._cond.notify()
+        
+        if not entry['done'].wait(timeout):
+            with self._cond:
+                if any(pending is entry for pending in self._pending):
+                    # Never handed to MongoDB, so it is safe to report failure (and to retry)
+                    self._pending = [pending for pending in self._pending if pending is not entry]
+                    raise TimeoutError('Timed out waiting for MongoDB batch insert')
+            # Already being written: report the real outcome rather than a retryable error
+            entry['done'].wait()
+        if entry['error']:
+            raise entry['error']
+        return document['_id']
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+            self._flush(batch)
+    
+    def _flush(self, batch):
+        try:
+            self.collection.bulk_write([InsertOne(entry['document']) for entry in batch], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                batch[error['index']]['error'] = RuntimeError(error.get('errmsg', 'Bulk insert failed'))
+        except Exception as e:
+            for entry in batch:
+                entry['error'] = e
+        for entry in batch:
+            entry['done'].set()
+
+
 class StorageManager:
     """Manages S3 and MongoDB storage operations."""
     
-    def __init__(self):
-        """Initialize S3 and MongoDB connections."""
+    def __init__(self, boto_config: Optional[Config] = None):
+        """
+        Initialize S3 and MongoDB connections.
+        
+        Args:
+            boto_config: botocore Config for the shared S3 client (connection pool, retries)
+        """
         # S3 Configuration - support both AWS_ACCESS_KEY_ID and ACCESS_KEY_ID
         self.s3_bucket_name = os.getenv('S3_BUCKET_NAME', 'transcription-audio-files')
         self.s3_region = os.getenv('S3_REGION', 'us-east-1')
@@ -33,13 +124,14 @@ class StorageManager:
                     's3',
                     region_name=self.s3_region,
                     aws_access_key_id=self.aws_access_key_id,
-                    aws_secret_access_key=self.aws_secret_access_key
+                    aws_secret_access_key=self.aws_secret_access_key,
+                    config=boto_config
                 )
                 print(f"✅ S3 client initialized with credentials")
                 print(f"   Bucket: {self.s3_bucket_name}, Region: {self.s3_region}")
             else:
                 # Use default credentials (IAM role, environment, or ~/.aws/credentials)
-                self.s3_client = boto3.client('s3', region_name=self.s3_region)
+                self.s3_client = boto3.client('s3', region_name=self.s3_region, config=boto_config)
                 print(f"✅ S3 client initialized with default credentials")
                 print(f"   Bucket: {self.s3_bucket_name}, Region: {self.s3_region}")
         except Exception as e:
@@ -48,7 +140,17 @@ class StorageManager:
         
         # Initialize MongoDB client
         try:
-            self.mongo_client = MongoClient(self.mongodb_uri)
+            # w=1 + journal: acknowledged by the primary's journal without waiting on replicas.
+            # Wire compression shrinks the large transcription documents (zlib is the fallback).
+            self.mongo_client = MongoClient(
+                self.mongodb_uri,
+                maxPoolSize=50,
+                minPoolSize=10,
+                w=1,
+                journal=True,
+                retryWrites=True,
+                compressors='zstd,zlib'
+            )
             self.db = self.mongo_client[self.mongodb_database]
             
             # Test connection with ping first
@@ -60,11 +162,15 @@ class StorageManager:
             # Get collection (MongoDB creates it automatically on first insert)
             self.collection = self.db[self.mongodb_collection]
             
+            # Concurrent saves are coalesced into bulk_write batches
+            self.insert_batcher = InsertBatcher(self.collection)
+            
             # Create indexes for better query performance
             try:
                 self.collection.create_index('created_at')
                 self.collection.create_index('user_id')
                 self.collection.create_index([('user_id', 1), ('created_at', -1)])  # Compound index
+                self.collection.create_index([('assigned_user_id', 1), ('created_at', -1)])  # Per-user listing
                 print(f"✅ Created indexes on 'created_at' and 'user_id' fields")
             except Exception as e:
                 # Index might already exist, which is fine
@@ -79,6 +185,7 @@ class StorageManager:
             self.mongo_client = None
             self.db = None
             self.collection = None
+            self.insert_batcher = None
     
     def _get_content_type(self, file_path: str) -> str:
         """Get content type based on file extension."""
@@ -166,12 +273,13 @@ class StorageManager:
             # Get content type based on file extension
             content_type = self._get_content_type(local_file_path)
             
-            # Upload file to S3
+            # Upload file to S3 (multipart, parts sent in parallel)
             self.s3_client.upload_file(
                 local_file_path,
                 self.s3_bucket_name,
                 s3_key,
-                ExtraArgs={'ContentType': content_type}
+                ExtraArgs={'ContentType': content_type},
+                Config=AUDIO_TRANSFER_CONFIG
             )
             
             # Generate S3 URL
@@ -238,15 +346,15 @@ class StorageManager:
                 'updated_at': datetime.now(timezone.utc)
             }
             
-            # Insert document (MongoDB will create collection automatically if it doesn't exist)
-            result = self.collection.insert_one(document)
+            # Insert document via the batcher (MongoDB will create collection automatically if it doesn't exist)
+            inserted_id = self.insert_batcher.insert(document)
             
             print(f"✅ Document saved to MongoDB collection '{self.mongodb_collection}'")
-            print(f"   Document ID: {result.inserted_id}")
+            print(f"   Document ID: {inserted_id}")
             
             return {
                 'success': True,
-                'document_id': str(result.inserted_id),
+                'document_id': str(inserted_id),
                 'message': 'Data saved to MongoDB successfully'
             }
             
@@ -326,9 +434,6 @@ class StorageManager:
             if not self.collection:
                 return None
                 
-            from bson import ObjectId
-            from bson.errors import InvalidId
-            
             # Validate ObjectId format
             try:
                 obj_id = ObjectId(document_id)
@@ -367,12 +472,12 @@ class StorageManager:
             print(traceback.format_exc())
             return None
     
-    def assign_transcription(self, document_id: str, assigned_user_id: str) -> Dict[str, Any]:
+    def assign_transcription(self, document_id: Union[str, ObjectId], assigned_user_id: str) -> Dict[str, Any]:
         """
         Assign a transcription to a specific user (admin only operation).
         
         Args:
-            document_id: MongoDB document ID
+            document_id: MongoDB document ID (string or already-parsed ObjectId)
             assigned_user_id: User ID to assign the transcription to
             
         Returns:
@@ -385,17 +490,17 @@ class StorageManager:
                     'error': 'MongoDB not initialized'
                 }
             
-            from bson import ObjectId
-            from bson.errors import InvalidId
-            
-            # Validate and convert ObjectId
-            try:
-                obj_id = ObjectId(document_id)
-            except (InvalidId, ValueError) as e:
-                return {
-                    'success': False,
-                    'error': f'Invalid transcription ID format: {str(e)}'
-                }
+            # Validate and convert ObjectId (callers may pass one they already parsed)
+            if isinstance(document_id, ObjectId):
+                obj_id = document_id
+            else:
+                try:
+                    obj_id = ObjectId(document_id)
+                except (InvalidId, TypeError) as e:
+                    return {
+                        'success': False,
+                        'error': f'Invalid transcription ID format: {str(e)}'
+                    }
             
             # Ensure assigned_user_id is stored as string for consistent filtering
             assigned_user_id_str = str(assigned_user_id)
@@ -417,19 +522,11 @@ class StorageManager:
                     'error': 'Transcription not found'
                 }
             
-            # Verify the assignment was saved correctly
-            updated_doc = self.collection.find_one({'_id': obj_id})
-            saved_assigned_id = updated_doc.get('assigned_user_id') if updated_doc else None
-            
-            print(f"✅ Assigned transcription {document_id} to user {assigned_user_id_str}")
-            print(f"   Verification: saved assigned_user_id = {saved_assigned_id}")
-            
-            if str(saved_assigned_id) != assigned_user_id_str:
-                print(f"⚠️  Warning: Assignment mismatch! Expected {assigned_user_id_str}, got {saved_assigned_id}")
+            print(f"✅ Assigned transcription {obj_id} to user {assigned_user_id_str}")
             
             return {
                 'success': True,
-                'document_id': document_id,
+                'document_id': str(obj_id),
                 'assigned_user_id': assigned_user_id_str,  # Return the string version for consistency
                 'message': 'Transcription assigned successfully'
             }
@@ -457,9 +554,6 @@ class StorageManager:
                     'error': 'MongoDB not initialized'
                 }
             
-            from bson import ObjectId
-            from bson.errors import InvalidId
-            
             # Validate and convert ObjectId
             try:
                 obj_id = ObjectId(document_id)
@@ -519,9 +613,6 @@ class StorageManager:
                     'error': 'MongoDB not initialized'
                 }
             
-            from bson import ObjectId
-            from bson.errors import InvalidId
-            
             # Validate and convert ObjectId
             try:
                 obj_id = ObjectId(document_id)
@@ -573,7 +664,8 @@ class StorageManager:
                 'error': f"Error flagging transcription: {str(e)}"
             }
 
-    def list_transcriptions(self, limit: int = 100, skip: int = 0, user_id: Optional[str] = None, is_admin: bool = False) -> Dict[str, Any]:
+    def list_transcriptions(self, limit: int = 100, skip: int = 0, user_id: Optional[str] = None, is_admin: bool = False,
+                            projection: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """
         List transcriptions from MongoDB.
         Regular users can only see transcriptions assigned to them.
@@ -584,6 +676,8 @@ class StorageManager:
             skip: Number of documents to skip
             user_id: User ID to filter transcriptions (if not admin)
             is_admin: Whether the user is an admin (admins see all transcriptions)
+            projection: MongoDB projection applied to the query, e.g. to skip the word/phrase
+                        arrays (edited_words_count is None when words are not fetched)
             
         Returns:
             Dictionary with list of transcriptions and metadata
@@ -625,7 +719,8 @@ class StorageManager:
             print(f"📊 Query filter: {query_filter}, Total count: {total_count}")
             
             # Get documents sorted by created_at descending (newest first)
-            cursor = self.collection.find(query_filter).sort('created_at', -1).skip(skip).limit(limit)
+            # (per-user listings are served by the assigned_user_id/created_at compound index)
+            cursor = self.collection.find(query_filter, projection).sort('created_at', -1).skip(skip).limit(limit)
             
             transcriptions = []
             for doc in cursor:
@@ -668,8 +763,11 @@ class StorageManager:
                 # Calculate edited words count (for words type transcriptions)
                 edited_words_count = 0
                 if transcription_data.get('transcription_type') == 'words':
-                    words = transcription_data.get('words', [])
-                    edited_words_count = sum(1 for word in words if word.get('is_edited', False))
+                    words = transcription_data.get('words')
+                    if words is None and projection:
+                        edited_words_count = None  # Words were projected out
+                    else:
+                        edited_words_count = sum(1 for word in words or [] if word.get('is_edited', False))
                 
                 # Determine status:
                 # - "flagged" if is_flagged is True (highest priority)
@@ -740,8 +838,6 @@ class StorageManager:
                     'error': 'MongoDB not initialized'
                 }
             
-            from bson import ObjectId
-            
             # Prepare update data
             update_data = {
                 'transcription_data': transcription_data,
@@ -798,8 +894,6 @@ class StorageManager:
                     'error': 'MongoDB not initialized'
                 }
             
-            from bson import ObjectId
-            
             # Get the document to extract S3 metadata before deleting (no user_id filtering)
             document = self.collection.find_one({'_id': ObjectId(document_id)})
             